@@ -22,7 +22,12 @@ if not DATABASE_PATH:
     import sys
     sys.exit(1)
 
-database = SqliteDatabase(DATABASE_PATH)
+# WAL lets readers run alongside a writer and, with synchronous=NORMAL,
+# commits only fsync at checkpoints instead of on every transaction
+database = SqliteDatabase(DATABASE_PATH, pragmas={
+    'journal_mode': 'wal',
+    'synchronous': 'normal',
+})
 
 def init_database():
     """Initialize database and create all tables"""
@@ -5,16 +5,58 @@ This module provides functionality to send emails using the Mailtrap API service
 """
 
 import os
+import re
+import threading
 import requests
 from typing import Optional
 from flask import current_app
 
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    _dumps = lambda obj: json.dumps(obj).encode('utf-8')
+
+
+# Recipient domains used by test/sample accounts - emails to these are never sent
+_TEST_DOMAINS = ('example.net', 'example.com', 'example.org')
+
+# Maximum number of messages per Mailtrap batch API request
+MAILTRAP_BATCH_LIMIT = 500
+
+# Patterns used by _strip_html to build the plain text version of an email
+_BLOCK_BOUNDARY_RE = re.compile(r'(?i)</(?:p|div|h[1-6]|li|tr)>|<br\s*/?>')
+_TAG_RE = re.compile(r'<.*?>')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
+
+# One HTTP session per thread, so consecutive sends reuse the TLS connection to Mailtrap
+_SESSIONS = threading.local()
+
 
 class EmailError(Exception):
     """Custom exception for email-related errors"""
     pass
 
 
+def _get_session() -> requests.Session:
+    """
+    Get this thread's HTTP session for the Mailtrap API
+    
+    requests.Session keeps connections alive, so only the first email sent
+    from a thread pays for the TCP and TLS handshake.
+    
+    Returns:
+        requests.Session: Session for the current thread
+    """
+    session = getattr(_SESSIONS, 'session', None)
+    if session is None:
+        session = requests.Session()
+        _SESSIONS.session = session
+    return session
+
+
 def send_email(to_email: str, subject: str, body: str, from_email: Optional[str] = None) -> bool:
     """
     Send an email via Mailtrap API
@@ -33,7 +75,7 @@ def send_email(to_email: str, subject: str, body: str, from_email: Optional[str]
     """
 
     # Don't send testing emails 
-    if to_email.lower().endswith("example.net") or to_email.lower().endswith("example.com"):
+    if to_email.lower().endswith(_TEST_DOMAINS):
         return True
     
     # Get Mailtrap configuration from environment variables
@@ -72,7 +114,7 @@ def send_email(to_email: str, subject: str, body: str, from_email: Optional[str]
     
     try:
         # Send the email via Mailtrap API
-        response = requests.post(url, json=email_data, headers=headers, timeout=30)
+        response = _get_session().post(url, data=_dumps(email_data), headers=headers, timeout=30)
         
         if response.status_code == 200:
             # Log successful send (optional)
@@ -99,6 +141,109 @@ def send_email(to_email: str, subject: str, body: str, from_email: Optional[str]
 
 
 
+def send_emails_bulk(messages: list, from_email: Optional[str] = None) -> list:
+    """
+    Send many emails via the Mailtrap batch API
+    
+    Messages are sent in batches of up to MAILTRAP_BATCH_LIMIT per request,
+    so N emails cost ceil(N / 500) HTTPS round trips instead of N.
+    
+    Args:
+        messages (list): List of dicts with 'to_email', 'subject' and 'body' keys
+        from_email (str, optional): Sender email address. If not provided, uses default from environment
+    
+    Returns:
+        list: One bool per message (in the same order) - True if that email was sent successfully
+    
+    Raises:
+        EmailError: If there's an error with email configuration
+    """
+    results = [True] * len(messages)
+    
+    # Don't send testing emails
+    pending = [(i, message) for i, message in enumerate(messages)
+               if not message['to_email'].lower().endswith(_TEST_DOMAINS)]
+    if not pending:
+        return results
+    
+    # Get Mailtrap configuration from environment variables
+    api_token = os.getenv('MAILTRAP_API_TOKEN')
+    if not api_token:
+        raise EmailError("MAILTRAP_API_TOKEN environment variable is not set")
+    
+    # Default sender email
+    if not from_email:
+        from_email = os.getenv('MAILTRAP_FROM_EMAIL', 'noreply@cosypolyamory.org')
+    
+    # Mailtrap batch API endpoint (same sending stream as send_email)
+    url = "https://send.api.mailtrap.io/api/batch"
+    
+    # Headers for the API request
+    headers = {
+        "Authorization": f"Bearer {api_token}",
+        "Content-Type": "application/json"
+    }
+    
+    for start in range(0, len(pending), MAILTRAP_BATCH_LIMIT):
+        batch = pending[start:start + MAILTRAP_BATCH_LIMIT]
+        
+        # Fields shared by every message go in "base"
+        batch_data = {
+            "base": {
+                "from": {
+                    "email": from_email,
+                    "name": "Cosy Polyamory Community"
+                }
+            },
+            "requests": [
+                {
+                    "to": [{"email": message['to_email']}],
+                    "subject": message['subject'],
+                    "html": message['body'],
+                    "text": _strip_html(message['body'])
+                }
+                for _, message in batch
+            ]
+        }
+        
+        # A failed batch only fails its own messages; earlier batches have
+        # already been delivered and later ones are still worth trying
+        try:
+            response = _get_session().post(url, data=_dumps(batch_data), headers=headers, timeout=30)
+        except requests.exceptions.RequestException as e:
+            if current_app:
+                current_app.logger.error(f"Network error while sending batch of {len(batch)} emails: {str(e)}")
+            for i, _ in batch:
+                results[i] = False
+            continue
+        
+        if response.status_code != 200:
+            if current_app:
+                current_app.logger.error(f"Failed to send batch of {len(batch)} emails. Status: {response.status_code}, Response: {response.text}")
+            for i, _ in batch:
+                results[i] = False
+            continue
+        
+        # The response holds one entry per request, in order
+        try:
+            responses = response.json().get('responses', [])
+        except ValueError:
+            if current_app:
+                current_app.logger.error(f"Invalid response to batch of {len(batch)} emails: {response.text}")
+            responses = []
+        for (i, message), result in zip(batch, responses):
+            results[i] = bool(result.get('success'))
+            if current_app:
+                if results[i]:
+                    current_app.logger.info(f"Email sent successfully to {message['to_email']} with subject: {message['subject']}")
+                else:
+                    current_app.logger.error(f"Failed to send email to {message['to_email']}: {result.get('errors')}")
+        for i, _ in batch[len(responses):]:
+            results[i] = False
+    
+    return results
+
+
 def _strip_html(html_content: str) -> str:
     """
     Simple HTML tag stripper for plain text email content
@@ -109,14 +254,12 @@ def _strip_html(html_content: str) -> str:
     Returns:
         str: Plain text content
     """
-    import re
-    
-    # Remove HTML tags
-    clean = re.compile('<.*?>')
-    text = re.sub(clean, '', html_content)
+    # Keep line breaks at block boundaries, then remove remaining HTML tags
+    text = _BLOCK_BOUNDARY_RE.sub('\n', html_content)
+    text = _TAG_RE.sub('', text)
     
     # Clean up whitespace
-    text = re.sub(r'\n\s*\n', '\n\n', text)  # Replace multiple newlines with double newlines
+    text = _BLANK_LINES_RE.sub('\n\n', text)  # Replace multiple newlines with double newlines
     text = text.strip()
     
     return text
@@ -9,6 +9,7 @@ import secrets
 from itsdangerous import URLSafeTimedSerializer, SignatureExpired, BadSignature
 from flask import current_app, url_for
 from typing import Optional, Tuple
+from cosypolyamory.database import database
 from cosypolyamory.models.email_verification import EmailVerification
 from cosypolyamory.models.user import User
 
@@ -17,10 +18,16 @@ def get_serializer():
     """
     Get a URLSafeTimedSerializer instance using the app's secret key
     
+    The serializer is created once per app and cached in app.extensions.
+    
     Returns:
         URLSafeTimedSerializer: Serializer for generating secure tokens
     """
-    return URLSafeTimedSerializer(current_app.secret_key)
+    serializer = current_app.extensions.get('email_verify_serializer')
+    if serializer is None:
+        serializer = URLSafeTimedSerializer(current_app.secret_key)
+        current_app.extensions['email_verify_serializer'] = serializer
+    return serializer
 
 
 def generate_verification_token(user_id: str, new_email: str) -> str:
@@ -41,13 +48,11 @@ def generate_verification_token(user_id: str, new_email: str) -> str:
     """
     serializer = get_serializer()
     
-    # Create a payload with user_id, new_email, and a random salt
-    # The salt adds extra randomness to prevent token reuse
-    payload = {
-        'user_id': user_id,
-        'new_email': new_email,
-        'salt': secrets.token_hex(16)
-    }
+    # Compact payload: [user_id, new_email, nonce]
+    # The short nonce only keeps tokens unique (the token column is unique and
+    # the signature timestamp has one-second resolution); the signature itself
+    # is already bound to the secret key and the 'email-verification' salt
+    payload = [user_id, new_email, secrets.token_urlsafe(6)]
     
     return serializer.dumps(payload, salt='email-verification')
 
@@ -71,8 +76,8 @@ def verify_verification_token(token: str, max_age: int = 86400) -> Optional[Tupl
             salt='email-verification',
             max_age=max_age
         )
-        return payload['user_id'], payload['new_email']
-    except (SignatureExpired, BadSignature, KeyError):
+        return payload[0], payload[1]
+    except (SignatureExpired, BadSignature, KeyError, IndexError, TypeError):
         return None
 
 
@@ -91,19 +96,20 @@ def create_email_verification(user: User, new_email: str, hours_valid: int = 24)
     # Generate secure token
     token = generate_verification_token(user.id, new_email)
     
-    # Cancel any existing pending verifications for this user
-    EmailVerification.delete().where(
-        (EmailVerification.user == user) & 
-        (EmailVerification.is_used == False)
-    ).execute()
-    
-    # Create new verification
-    verification = EmailVerification.create_verification(
-        user=user,
-        new_email=new_email,
-        token=token,
-        hours_valid=hours_valid
-    )
+    with database.atomic():
+        # Supersede any existing pending verifications for this user
+        EmailVerification.update(is_used=True).where(
+            (EmailVerification.user == user) & 
+            (EmailVerification.is_used == False)
+        ).execute()
+        
+        # Create new verification
+        verification = EmailVerification.create_verification(
+            user=user,
+            new_email=new_email,
+            token=token,
+            hours_valid=hours_valid
+        )
     
     return verification
 
@@ -127,11 +133,14 @@ def verify_email_change(token: str) -> Tuple[bool, Optional[str], Optional[User]
     Process an email verification
     
     This function:
-    1. Validates the token cryptographically
-    2. Checks if it exists in the database and is unused
-    3. Verifies the token hasn't expired
-    4. Updates the user's email if all checks pass
-    5. Marks the verification as used
+    1. Looks up the verification record by token
+    2. Checks it is unused and has not expired
+    3. Updates the user's email if all checks pass
+    4. Marks the verification as used
+    
+    The database record is authoritative: it is keyed by the (signed) token and
+    stores the user and new email, so the token is only decoded cryptographically
+    when no record exists.
     
     Args:
         token: The verification token
@@ -139,25 +148,19 @@ def verify_email_change(token: str) -> Tuple[bool, Optional[str], Optional[User]
     Returns:
         tuple: (success: bool, message: str, user: User or None)
     """
-    # First verify the token cryptographically
-    result = verify_verification_token(token)
-    if not result:
-        return False, "Invalid or expired verification link.", None
-    
-    user_id, new_email = result
-    
     # Get the verification record from database
-    verification = EmailVerification.get_valid_verification(token)
-    if not verification:
+    verification = EmailVerification.get_or_none(EmailVerification.token == token)
+    if verification is None:
+        # No record - tell a forged/expired token apart from one already cleaned up
+        if not verify_verification_token(token):
+            return False, "Invalid or expired verification link.", None
         return False, "This verification link has expired or already been used.", None
     
-    # Double-check the user_id matches
-    if verification.user.id != user_id:
-        return False, "Invalid verification link.", None
+    if not verification.is_valid():
+        return False, "This verification link has expired or already been used.", None
     
-    # Double-check the email matches
-    if verification.new_email != new_email:
-        return False, "Invalid verification link.", None
+    user_id = verification.user_id
+    new_email = verification.new_email
     
     # Check if the new email is already in use by another user
     try:
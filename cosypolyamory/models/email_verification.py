@@ -3,7 +3,8 @@ Email verification model for secure email changes
 """
 
 from datetime import datetime, timedelta
-from peewee import CharField, DateTimeField, ForeignKeyField, BooleanField
+from peewee import CharField, DateTimeField, ForeignKeyField, BooleanField, SQL
+from cosypolyamory.database import database
 from cosypolyamory.models import BaseModel
 from cosypolyamory.models.user import User
 
@@ -15,7 +16,7 @@ class EmailVerification(BaseModel):
     new_email = CharField()  # The email address to be verified
     token = CharField(unique=True, index=True)  # Secure verification token
     created_at = DateTimeField(default=datetime.now)
-    expires_at = DateTimeField()  # Token expiration time
+    expires_at = DateTimeField(index=True)  # Token expiration time
     verified_at = DateTimeField(null=True)  # When the verification was completed
     is_used = BooleanField(default=False)  # Whether the token has been used
     
@@ -78,16 +79,39 @@ class EmailVerification(BaseModel):
             return None
     
     @classmethod
-    def cleanup_expired(cls, days_old=7):
+    def cleanup_expired(cls, days_old=7, batch_size=1000):
         """
         Delete expired verification records older than specified days
         
+        Records are deleted in batches, each in its own transaction, so a large
+        backlog does not hold the database write lock for the whole sweep.
+        
         Args:
             days_old: Delete records older than this many days (default: 7)
+            batch_size: Maximum number of records deleted per batch (default: 1000)
         
         Returns:
             int: Number of records deleted
         """
         cutoff_date = datetime.now() - timedelta(days=days_old)
-        deleted = cls.delete().where(cls.expires_at < cutoff_date).execute()
+        deleted = 0
+        while True:
+            batch = (cls.select(cls.id)
+                     .where(cls.expires_at < cutoff_date)
+                     .limit(batch_size))
+            with database.atomic():
+                count = cls.delete().where(cls.id.in_(batch)).execute()
+            deleted += count
+            if count < batch_size:
+                break
         return deleted
+
+
+# Partial index backing the "pending verifications for a user" lookups
+EmailVerification.add_index(
+    EmailVerification.index(
+        EmailVerification.user,
+        where=SQL('is_used = 0'),  # SQLite rejects bound parameters here
+        name='email_verifications_user_pending'
+    )
+)
@@ -43,6 +43,10 @@ class Event(BaseModel):
     
     class Meta:
         table_name = 'events'
+        indexes = (
+            (('exact_time', 'organizer'), False),  # Past events hosted per organizer
+            (('exact_time', 'co_host'), False),  # Past events hosted per co-host
+        )
     
     def __str__(self):
         return f"{self.title} - {self.date.strftime('%Y-%m-%d')}"
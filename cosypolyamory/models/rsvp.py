@@ -29,6 +29,7 @@ class RSVP(BaseModel):
         table_name = 'rsvps'
         indexes = (
             (('event', 'user'), True),  # Unique constraint: one RSVP per user per event
+            (('event', 'status'), False),  # Event roster lookups by status
         )
     
     def __str__(self):
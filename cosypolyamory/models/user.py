@@ -16,7 +16,7 @@ class User(UserMixin, BaseModel):
     provider = CharField()  # 'google' or 'github'
     pronouns = CharField(null=True)  # e.g., "they/them", "she/her", "he/him"
     created_at = DateTimeField(default=datetime.now)
-    last_login = DateTimeField(default=datetime.now)
+    last_login = DateTimeField(default=datetime.now, index=True)
     
     # User roles and status
     is_admin = BooleanField(default=False)
@@ -27,6 +27,9 @@ class User(UserMixin, BaseModel):
     
     class Meta:
         table_name = 'users'
+        indexes = (
+            (('role', 'created_at'), False),  # Role filters and per-role lists ordered by sign-up date
+        )
     
     def __str__(self):
         return f"User({self.name} - {self.email})"
@@ -2,34 +2,146 @@
 User application model for the approval process
 """
 
+import functools
+import itertools
 import json
 import os
+import re
 from datetime import datetime
 from peewee import CharField, TextField, DateTimeField, BooleanField, ForeignKeyField
 from cosypolyamory.models import BaseModel
 from cosypolyamory.models.user import User
 
-class UserApplication(BaseModel):
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = lambda obj: orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# Marks the answer caches as not yet filled (None is a valid `answers` value)
+_NOT_LOADED = object()
+
+# Matches QUESTION_<n> but not e.g. QUESTION_<n>_MINMAX_CHARACTERS
+_QUESTION_ENV_RE = re.compile(r'QUESTION_(\d+)$')
+
+
+@functools.lru_cache(maxsize=1)
+def _load_questions_from_env():
+    """
+    Read the QUESTION_<n> environment variables once
+    
+    Returns a tuple of (question_key, question_text) pairs. Call
+    _load_questions_from_env.cache_clear() after changing the configuration.
+    """
+    # One pass over the environment instead of probing QUESTION_1, QUESTION_2, ...
+    numbered = {}
+    for key, value in os.environ.items():
+        match = _QUESTION_ENV_RE.match(key)
+        if match:
+            numbered[int(match.group(1))] = value
+    
+    # Questions are numbered from 1 and stop at the first gap
+    questions = []
+    i = 1
+    while i in numbered:
+        questions.append((f'question_{i}', numbered[i]))
+        i += 1
+    return tuple(questions)
+
+
+def normalize_stored_answers(stored_data):
+    """
+    Convert decoded `answers` data to the canonical storage format
+    
+    Applications are stored as {"question_1": {"question": "...", "answer": "..."}}.
+    Older rows may hold a plain list of answers or {"question_1": "answer"};
+    those are matched up with the questions from the environment.
+    
+    Returns an empty dict for empty or unrecognised data.
+    """
+    if not stored_data:
+        return {}
+    
+    try:
+        if isinstance(stored_data, dict):
+            first_value = next(iter(stored_data.values()))
+            if isinstance(first_value, dict) and 'question' in first_value:
+                # Already canonical
+                return stored_data
+            
+            # Simple format: {"question_1": "answer"}
+            questions = dict(_load_questions_from_env())
+            return {
+                question_key: {
+                    'question': questions.get(question_key, f'Question {question_key.split("_")[1]}'),
+                    'answer': answer
+                }
+                for question_key, answer in stored_data.items()
+            }
+        
+        if isinstance(stored_data, list):
+            # Old format: answers in question order
+            return {
+                question_key: {'question': question, 'answer': answer}
+                for (question_key, question), answer in zip(_load_questions_from_env(), stored_data)
+            }
+    except (TypeError, IndexError):
+        pass
+    
+    return {}
+
+
+class _AnswerCacheSlots:
+    """Slots for UserApplication's parsed-answer caches, kept out of the instance __dict__"""
+    __slots__ = ('_cache_source', '_answers_cache', '_qa_cache')
+
+
+class UserApplication(BaseModel, _AnswerCacheSlots):
     """User application for community approval"""
-    user = ForeignKeyField(User, backref='application')
+    user = ForeignKeyField(User, backref='application', index=False)  # Indexed with submitted_at below
     
-    # Store all questionnaire responses as JSON array
-    answers = TextField(null=True)  # JSON array of answers
+    # Store all questionnaire responses as JSON, see normalize_stored_answers
+    answers = TextField(null=True)  # {"question_1": {"question": "...", "answer": "..."}}
     
-    submitted_at = DateTimeField(default=datetime.now)
+    submitted_at = DateTimeField(default=datetime.now, index=True)
     reviewed_at = DateTimeField(null=True)
     reviewed_by = ForeignKeyField(User, null=True, backref='reviewed_applications')
     review_notes = TextField(null=True)
     
     class Meta:
         table_name = 'user_applications'
+        indexes = (
+            (('user', 'submitted_at'), False),  # Latest application per user
+        )
+    
+    def __init__(self, *args, **kwargs):
+        # Parsed forms of `answers`, cached for the `answers` value in
+        # _cache_source (reset when `answers` changes)
+        self._cache_source = _NOT_LOADED
+        self._answers_cache = None
+        self._qa_cache = None
+        super().__init__(*args, **kwargs)
     
     @property
     def status(self):
         """Derive status from user role"""
-        if self.user.role == 'approved':
+        return self.status_for_role(self.user.role)
+    
+    @staticmethod
+    def status_for_role(role):
+        """Get the application status implied by a user role
+        
+        Args:
+            role: The applicant's user role
+        
+        Returns:
+            str: 'approved', 'rejected' or 'pending'
+        """
+        if role == 'approved':
             return 'approved'
-        elif self.user.role == 'rejected':
+        elif role == 'rejected':
             return 'rejected'
         else:
             return 'pending'
@@ -37,103 +149,52 @@ class UserApplication(BaseModel):
     @staticmethod
     def get_questions_from_env():
         """Get all questions from environment variables as a dictionary"""
-        questions = {}
-        i = 1
-        while True:
-            question = os.getenv(f'QUESTION_{i}')
-            if question is None:
-                break
-            questions[f'question_{i}'] = question
-            i += 1
-        return questions
+        return dict(_load_questions_from_env())
     
     @staticmethod
     def get_question_count():
         """Get the number of questions from environment"""
-        return len(UserApplication.get_questions_from_env())
+        return len(_load_questions_from_env())
     
     def get_answers(self):
         """Get answers as a dictionary of question_key -> answer"""
-        if self.answers:
-            try:
-                stored_data = json.loads(self.answers)
-                # Handle both old format (list) and new format (dict with questions+answers)
-                if isinstance(stored_data, list):
-                    # Old format: convert to question_key -> answer mapping
-                    questions = self.get_questions_from_env()
-                    result = {}
-                    for i, answer in enumerate(stored_data):
-                        if i < len(questions):
-                            question_key = list(questions.keys())[i]
-                            result[question_key] = answer
-                    return result
-                elif isinstance(stored_data, dict):
-                    # New format: extract answers from question/answer pairs
-                    if stored_data and 'question' in next(iter(stored_data.values()), {}):
-                        # Format: {"question_1": {"question": "...", "answer": "..."}}
-                        return {k: v.get('answer', '') for k, v in stored_data.items()}
-                    else:
-                        # Simple format: {"question_1": "answer"}
-                        return stored_data
-                return {}
-            except (json.JSONDecodeError, TypeError):
-                return {}
-        return {}
+        self._check_caches()
+        if self._answers_cache is None:
+            self._answers_cache = {k: v.get('answer', '') for k, v in self._qa_cache.items()}
+        return self._answers_cache
     
     def get_questions_and_answers(self):
         """Get stored questions and answers as dictionary"""
-        if self.answers:
-            try:
-                stored_data = json.loads(self.answers)
-                # Handle both old format (list) and new format (dict with questions+answers)
-                if isinstance(stored_data, list):
-                    # Old format: use .env questions with stored answers
-                    questions = self.get_questions_from_env()
-                    result = {}
-                    for i, answer in enumerate(stored_data):
-                        if i < len(questions):
-                            question_key = list(questions.keys())[i]
-                            result[question_key] = {
-                                'question': questions[question_key],
-                                'answer': answer
-                            }
-                    return result
-                elif isinstance(stored_data, dict):
-                    # Check if it's the full format with questions and answers
-                    first_value = next(iter(stored_data.values()), {})
-                    if isinstance(first_value, dict) and 'question' in first_value:
-                        # Format: {"question_1": {"question": "...", "answer": "..."}}
-                        return stored_data
-                    else:
-                        # Simple format: {"question_1": "answer"} - need to get questions from env
-                        questions = self.get_questions_from_env()
-                        result = {}
-                        for question_key, answer in stored_data.items():
-                            result[question_key] = {
-                                'question': questions.get(question_key, f'Question {question_key.split("_")[1]}'),
-                                'answer': answer
-                            }
-                        return result
-                return {}
-            except (json.JSONDecodeError, TypeError):
-                return {}
-        return {}
+        self._check_caches()
+        return self._qa_cache
+    
+    def _check_caches(self):
+        """Decode the stored JSON once per `answers` value, dropping stale parsed caches"""
+        if self._cache_source is not self.answers:
+            stored_data = None
+            if self.answers:
+                try:
+                    stored_data = _json_loads(self.answers)
+                except (json.JSONDecodeError, TypeError):
+                    pass
+            self._cache_source = self.answers
+            self._qa_cache = normalize_stored_answers(stored_data)
+            self._answers_cache = None
     
     def set_answers(self, answers_dict):
         """Set answers from a dictionary (question_key -> answer)"""
-        self.answers = json.dumps(answers_dict) if answers_dict else None
+        self.set_questions_and_answers(normalize_stored_answers(answers_dict))
     
     def set_questions_and_answers(self, qa_dict):
         """Set both questions and answers from dictionary"""
         # Format: {"question_1": {"question": "...", "answer": "..."}}
-        self.answers = json.dumps(qa_dict) if qa_dict else None
+        self.answers = _json_dumps(qa_dict) if qa_dict else None
     
     def get_answer(self, question_index):
         """Get a specific answer by index (0-based)"""
         answers = self.get_answers()
-        question_keys = list(answers.keys())
-        if 0 <= question_index < len(question_keys):
-            return answers[question_keys[question_index]]
+        if 0 <= question_index < len(answers):
+            return next(itertools.islice(answers.values(), question_index, None))
         return None
     
     def get_question_text(self, question_key):
@@ -141,16 +202,11 @@ class UserApplication(BaseModel):
         qa_data = self.get_questions_and_answers()
         return qa_data.get(question_key, {}).get('question', '')
     
-    def __getattr__(self, name):
-        """Dynamic attribute access for backward compatibility"""
-        if name.startswith('question_') and name.endswith('_answer'):
-            # Extract question number from attribute name like 'question_5_answer'
-            try:
-                question_num = int(name.split('_')[1])
-                return self.get_answer(question_num - 1)  # Convert to 0-based index
-            except (ValueError, IndexError):
-                return None
-        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
-    
     def __str__(self):
         return f"Application for {self.user.name} - {self.status}"
+
+
+# question_<n>_answer attributes for backward compatibility, one per configured question
+for _question_num in range(1, UserApplication.get_question_count() + 1):
+    setattr(UserApplication, f'question_{_question_num}_answer',
+            property(lambda self, i=_question_num: self.get_answer(i - 1)))  # Convert to 0-based index
@@ -5,11 +5,39 @@ This module provides functionality to send notification emails using Jinja2 temp
 stored in the templates/notifications directory.
 """
 
-from cosypolyamory.email import send_email, EmailError
-from flask import render_template, current_app, url_for
+from cosypolyamory.email import send_email, send_emails_bulk, EmailError
+from cosypolyamory.models.user import User
+from cosypolyamory.models.user_application import UserApplication
+from flask import current_app, url_for, request, has_request_context
+from markupsafe import escape
+from datetime import datetime
 import os
-import re
 import html
+import functools
+import logging
+import queue
+import threading
+
+# Available notification templates, loaded on first use by _ensure_templates_loaded
+_TEMPLATE_SET = None
+_TEMPLATE_LIST = None
+_TEMPLATE_LOCK = threading.Lock()
+
+# Child of the Flask app logger ('cosypolyamory.app'), so it shares its level and handlers
+logger = logging.getLogger('cosypolyamory.app.notification')
+
+# Notifications queued by send_in_background, sent by a single worker thread
+_NOTIFICATION_QUEUE = queue.Queue()
+_NOTIFICATION_WORKER = None
+_NOTIFICATION_WORKER_LOCK = threading.Lock()
+
+# Entities produced by Jinja's autoescaping, undone by _fast_unescape (&amp; last)
+_AUTOESCAPE_ENTITIES = (
+    ('&lt;', '<'), ('&gt;', '>'), ('&#34;', '"'), ('&quot;', '"'), ('&#39;', "'"), ('&amp;', '&'),
+)
+
+# Stand-in for the recipient's name when a template is rendered once for many users
+_NAME_PLACEHOLDER = '__COSY_RECIPIENT_NAME__'
 
 
 def send_notification_email(to_email: str, template_name: str, **template_vars) -> bool:
@@ -28,55 +56,354 @@ def send_notification_email(to_email: str, template_name: str, **template_vars)
         EmailError: If template is not found or email sending fails
     """
     
-    # Validate template exists
-    template_path = f"notifications/{template_name}.html"
-    template_file_path = os.path.join(
-        current_app.template_folder if current_app else 'cosypolyamory/templates',
-        template_path
-    )
+    app = current_app._get_current_object()
     
-    if not os.path.exists(template_file_path):
+    # Validate template exists
+    if template_name not in _ensure_templates_loaded():
         available_templates = _get_available_templates()
         raise EmailError(f"Template '{template_name}' not found. Available templates: {available_templates}")
     
     try:
         # Render the email template
-        html_content = render_template(template_path, **template_vars)
-        
-        # Extract subject from the rendered template
-        subject = _extract_subject_from_html(html_content)
+        subject, html_content = _render_notification(app, template_name, template_vars)
         if not subject:
-            raise EmailError(f"Could not extract subject from template '{template_name}'. Make sure the template has a <title> tag or uses {{% block subject %}}.")
+            raise EmailError(f"Template '{template_name}' has an empty subject. Make sure it defines {{% block subject %}}.")
         
         # Send the email
         return send_email(to_email, subject, html_content)
         
     except Exception as e:
-        if current_app:
-            current_app.logger.error(f"Error sending notification email '{template_name}' to {to_email}: {e}")
+        logger.error(f"Error sending notification email '{template_name}' to {to_email}: {e}")
         raise EmailError(f"Failed to send notification email: {e}")
 
 
-def _extract_subject_from_html(html_content: str) -> str:
+def send_notification_emails(template_name: str, recipients: list, app=None) -> list:
+    """
+    Send a notification email to many recipients using batched API requests
+    
+    Each recipient gets their own rendering of the template, but all emails
+    are delivered through send_emails_bulk in as few requests as possible.
+    
+    Args:
+        template_name (str): Name of the email template to use (without .html extension)
+        recipients (list): List of (to_email, template_vars) tuples
+        app: Flask app to render with (defaults to the current app)
+    
+    Returns:
+        list: One bool per recipient (in the same order) - True if that email was sent successfully
+    
+    Raises:
+        EmailError: If template is not found or email configuration is invalid
+    """
+    
+    if app is None:
+        app = current_app._get_current_object()
+    
+    # Validate template exists
+    if template_name not in _ensure_templates_loaded():
+        available_templates = _get_available_templates()
+        raise EmailError(f"Template '{template_name}' not found. Available templates: {available_templates}")
+    
+    # Render every email first; a failed render only affects that recipient
+    results = [False] * len(recipients)
+    messages = []
+    message_indexes = []
+    for i, (to_email, template_vars) in enumerate(recipients):
+        if not to_email:
+            # Nowhere to send it - don't bother rendering
+            continue
+        try:
+            subject, html_content = _render_notification(app, template_name, template_vars)
+            if not subject:
+                raise EmailError(f"Template '{template_name}' has an empty subject. Make sure it defines {{% block subject %}}.")
+            messages.append({'to_email': to_email, 'subject': subject, 'body': html_content})
+            message_indexes.append(i)
+        except Exception as e:
+            logger.error(f"Error rendering notification email '{template_name}' for {to_email}: {e}")
+    
+    try:
+        sent = send_emails_bulk(messages)
+    except Exception as e:
+        logger.error(f"Error sending notification email '{template_name}' to {len(messages)} recipients: {e}")
+        raise EmailError(f"Failed to send notification emails: {e}")
+    
+    for i, success in zip(message_indexes, sent):
+        results[i] = success
+    
+    return results
+
+
+def send_bulk_notification(users, template_name: str, shared_vars: dict, per_user_vars_fn=None, app=None) -> list:
+    """
+    Send the same notification to many users
+    
+    When only the recipient's name differs between emails, the template is
+    rendered once with a placeholder name which is then substituted (escaped)
+    for each user. If per_user_vars_fn is given, each email is rendered with
+    shared_vars updated by per_user_vars_fn(user) instead.
+    
+    Args:
+        users: Iterable of User model instances
+        template_name (str): Name of the email template to use (without .html extension)
+        shared_vars (dict): Template variables common to every recipient
+        per_user_vars_fn: Optional callable returning extra template variables for a user
+        app: Flask app to render with (defaults to the current app)
+    
+    Returns:
+        list: One bool per user (in the same order) - True if that email was sent successfully
+    
+    Raises:
+        EmailError: If template is not found or email configuration is invalid
+    """
+    users = list(users)
+    if not any(user.email for user in users):
+        return [False] * len(users)
+    
+    if app is None:
+        app = current_app._get_current_object()
+    
+    if per_user_vars_fn is not None:
+        return send_notification_emails(
+            template_name,
+            [(user.email, dict(shared_vars, name=user.name, **per_user_vars_fn(user))) for user in users],
+            app=app
+        )
+    
+    # Validate template exists
+    if template_name not in _ensure_templates_loaded():
+        available_templates = _get_available_templates()
+        raise EmailError(f"Template '{template_name}' not found. Available templates: {available_templates}")
+    
+    try:
+        subject, html_content = _render_notification(app, template_name, dict(shared_vars, name=_NAME_PLACEHOLDER))
+        if not subject:
+            raise EmailError(f"Template '{template_name}' has an empty subject. Make sure it defines {{% block subject %}}.")
+    except Exception as e:
+        logger.error(f"Error rendering notification email '{template_name}': {e}")
+        raise EmailError(f"Failed to render notification email: {e}")
+    
+    results = [False] * len(users)
+    messages = []
+    message_indexes = []
+    for i, user in enumerate(users):
+        if not user.email:
+            continue
+        name = user.name or ''
+        messages.append({
+            'to_email': user.email,
+            'subject': subject.replace(_NAME_PLACEHOLDER, name),
+            'body': html_content.replace(_NAME_PLACEHOLDER, str(escape(name)))
+        })
+        message_indexes.append(i)
+    
+    try:
+        sent = send_emails_bulk(messages)
+    except Exception as e:
+        logger.error(f"Error sending notification email '{template_name}' to {len(messages)} recipients: {e}")
+        raise EmailError(f"Failed to send notification emails: {e}")
+    
+    for i, success in zip(message_indexes, sent):
+        results[i] = success
+    
+    return results
+
+
+def bulk_notify(event, users, template_name: str, **template_vars) -> list:
+    """
+    Send an event notification to many users at once
+    
+    `users` may be a query; it is evaluated exactly once. It should select the
+    User rows themselves (e.g. User.select().join(RSVP)) rather than RSVPs, so
+    that no per-recipient query is needed to reach user.email / user.name.
+    The event's fields are read and formatted once for all recipients.
+    Must be called within a request, as it builds the event's URL.
+    
+    Args:
+        event: Event model instance
+        users: List or query of User model instances
+        template_name (str): Name of the email template to use (without .html extension)
+        **template_vars: Extra variables for the template, overriding the event defaults
+    
+    Returns:
+        list: One bool per user (in the same order) - True if that email was sent successfully
+    
+    Raises:
+        EmailError: If template is not found or email configuration is invalid
+    """
+    shared_vars = dict(
+        event_title=event.title,
+        **_format_event_times(event),
+        event_location=event.establishment_name or "Location TBD",
+        event_url=_event_url(event)
+    )
+    shared_vars.update(template_vars)
+    return send_bulk_notification(list(users), template_name, shared_vars)
+
+
+def send_in_background(func, *args, **kwargs):
+    """
+    Run a notification function on the background worker instead of in the request
+    
+    The function runs later, in an application context (not a request
+    context), so it must not need the request - e.g. pass model instances
+    rather than current_user, and don't use helpers that build external URLs.
+    Its return value is discarded; failures are logged.
+    
+    Args:
+        func: Notification function to call, e.g. notify_organizers_new_application
+        *args, **kwargs: Arguments for func
+    """
+    global _NOTIFICATION_WORKER
+    app = current_app._get_current_object()
+    
+    if _NOTIFICATION_WORKER is None or not _NOTIFICATION_WORKER.is_alive():
+        with _NOTIFICATION_WORKER_LOCK:
+            if _NOTIFICATION_WORKER is None or not _NOTIFICATION_WORKER.is_alive():
+                _NOTIFICATION_WORKER = threading.Thread(
+                    target=_notification_worker, name='notification-worker', daemon=True
+                )
+                _NOTIFICATION_WORKER.start()
+    
+    _NOTIFICATION_QUEUE.put((app, func, args, kwargs))
+
+
+def _notification_worker():
+    """Send queued notifications one at a time, forever"""
+    while True:
+        app, func, args, kwargs = _NOTIFICATION_QUEUE.get()
+        try:
+            with app.app_context():
+                func(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"Error in background notification {getattr(func, '__name__', func)}: {e}")
+        finally:
+            _NOTIFICATION_QUEUE.task_done()
+
+
+def _render_notification(app, template_name: str, template_vars: dict) -> tuple:
+    """
+    Render a notification template's subject and body, compiling it only once per app
+    
+    Equivalent to render_template (context processors such as base_url still
+    apply, explicit variables win) but skips the per-call template lookup,
+    auto-reload check and render signals.
+    
+    Args:
+        app: Flask app
+        template_name (str): Name of the email template (without .html extension)
+        template_vars (dict): Variables to pass to the template
+    
+    Returns:
+        tuple: (subject, html) - the subject is the template's subject block with
+               HTML entities unescaped, empty if the block is missing
+    """
+    compiled = app.extensions.setdefault('notification_templates', {})
+    template = compiled.get(template_name)
+    if template is None:
+        template = app.jinja_env.get_template(f"notifications/{template_name}.html")
+        compiled[template_name] = template
+    
+    context = dict(template_vars)
+    app.update_template_context(context)
+    
+    subject_block = template.blocks.get('subject')
+    subject = ''
+    if subject_block is not None:
+        # Autoescaped output, e.g. &amp; -> &
+        subject = _fast_unescape(''.join(subject_block(template.new_context(context)))).strip()
+    
+    return subject, template.render(context)
+
+
+def _event_url(event) -> str:
     """
-    Extract the email subject from the rendered HTML template
+    Get the external URL of an event's page, built once per event and host
     
     Args:
-        html_content (str): Rendered HTML content
+        event: Event model instance
     
     Returns:
-        str: Email subject line with HTML entities unescaped
+        str: Absolute URL of the event detail page
     """
-    # Try to extract from <title> tag first
-    title_match = re.search(r'<title>(.*?)</title>', html_content, re.DOTALL | re.IGNORECASE)
-    if title_match:
-        subject = title_match.group(1).strip()
-        # Unescape HTML entities (e.g., &amp; -> &, &lt; -> <, &gt; -> >)
-        subject = html.unescape(subject)
-        subject = re.sub(r'\s*-\s*Cosy Polyamory\s*$', '', subject)
-        return subject
+    # The external URL depends on the host the request came in on
+    host_url = request.host_url if has_request_context() else None
+    return _event_url_cached(event.id, host_url)
+
+
+@functools.lru_cache(maxsize=128)
+def _event_url_cached(event_id, host_url) -> str:
+    return url_for('events.event_detail', event_id=event_id, _external=True)
+
+
+def _fast_unescape(text: str) -> str:
+    """
+    Unescape HTML entities in a short string such as an email subject
     
-    return ""
+    Handles the entities Jinja's autoescaping produces with plain replaces and
+    only falls back to html.unescape when anything else is present.
+    """
+    if '&' not in text:
+        return text
+    if sum(text.count(entity) for entity, _ in _AUTOESCAPE_ENTITIES) != text.count('&'):
+        return html.unescape(text)
+    for entity, char in _AUTOESCAPE_ENTITIES:
+        text = text.replace(entity, char)
+    return text
+
+
+def _format_event_times(event) -> dict:
+    """
+    Format an event's date and times for use in notification templates
+    
+    Args:
+        event: Event model instance
+    
+    Returns:
+        dict: event_date, event_time ("TBD" if unset) and end_time (None if unset)
+    """
+    return dict(_format_event_times_cached(event.date, event.exact_time, event.end_time))
+
+
+@functools.lru_cache(maxsize=256)
+def _format_event_times_cached(date, exact_time, end_time) -> tuple:
+    return (
+        ('event_date', date.strftime('%A, %B %d, %Y')),
+        ('event_time', exact_time.strftime('%I:%M %p') if exact_time else "TBD"),
+        ('end_time', end_time.strftime('%I:%M %p') if end_time else None),
+    )
+
+
+def _ensure_templates_loaded() -> frozenset:
+    """
+    Load the set of available notification templates on first use
+    
+    The templates directory is scanned once; call invalidate_template_cache()
+    to pick up added or removed templates (e.g. during development).
+    
+    Returns:
+        frozenset: Available template names (without .html extension)
+    """
+    global _TEMPLATE_SET, _TEMPLATE_LIST
+    if _TEMPLATE_SET is None:
+        with _TEMPLATE_LOCK:
+            if _TEMPLATE_SET is None:
+                template_list = _scan_available_templates()
+                if not template_list:
+                    # Nothing found (or the scan failed) - don't cache, retry next time
+                    return frozenset()
+                _TEMPLATE_LIST = template_list
+                _TEMPLATE_SET = frozenset(template_list)
+    return _TEMPLATE_SET
+
+
+def invalidate_template_cache():
+    """Forget the cached notification templates so they are rescanned and recompiled on next use"""
+    global _TEMPLATE_SET, _TEMPLATE_LIST
+    with _TEMPLATE_LOCK:
+        _TEMPLATE_SET = None
+        _TEMPLATE_LIST = None
+    if current_app:
+        current_app.extensions.pop('notification_templates', None)
 
 
 def _get_available_templates() -> list:
@@ -86,21 +413,28 @@ def _get_available_templates() -> list:
     Returns:
         list: List of available template names (without .html extension)
     """
+    _ensure_templates_loaded()
+    return list(_TEMPLATE_LIST or [])
+
+
+def _scan_available_templates() -> list:
+    """
+    Scan the notifications template directory
+    
+    Returns:
+        list: Sorted list of template names (without .html extension)
+    """
     try:
         template_dir = os.path.join(
             current_app.template_folder if current_app else 'cosypolyamory/templates',
             'notifications'
         )
         
-        if not os.path.exists(template_dir):
-            return []
-        
-        templates = []
-        for file in os.listdir(template_dir):
-            if file.endswith('.html') and file != 'base.html':
-                templates.append(file[:-5])  # Remove .html extension
-        
-        return sorted(templates)
+        # A missing directory raises FileNotFoundError, handled below
+        with os.scandir(template_dir) as entries:
+            # Strip the .html extension
+            return sorted(entry.name[:-5] for entry in entries
+                          if entry.name.endswith('.html') and entry.name != 'base.html')
         
     except Exception:
         return []
@@ -132,33 +466,74 @@ def get_template_info() -> dict:
 
 # High-level notification functions for specific use cases
 
-def notify_application_approved(user):
+def _notify_user(user, template_name: str, description: str, event=None, **template_vars) -> bool:
     """
-    Send approval notification email to a user
+    Send a notification email to a single user and log the outcome
+    
+    Shared body of the notify_* / send_* helpers below; each of them only
+    decides which template to use and what variables to pass.
     
     Args:
-        user: User model instance with approved application
+        user: User model instance to notify
+        template_name (str): Name of the email template to use (without .html extension)
+        description (str): What is being sent, for log messages (e.g. "approval email")
+        event: Optional Event model instance the notification is about, for log messages
+        **template_vars: Variables to pass to the template (name is added automatically)
+    
+    Returns:
+        bool: True if email was sent successfully, False otherwise
     """
+    if not user.email:
+        return False
+    
+    for_event = f" for event: {event.title}" if event is not None else ""
+    
     try:
         success = send_notification_email(
             to_email=user.email,
-            template_name="application_approved",
+            template_name=template_name,
             name=user.name,
-            base_url=current_app.config.get('BASE_URL', 'https://cosypolyamory.org')
+            **template_vars
         )
         
         if success:
-            current_app.logger.info(f"Approval email sent to {user.email}")
+            logger.info(f"{description[:1].upper()}{description[1:]} sent to {user.email}{for_event}")
         else:
-            current_app.logger.warning(f"Failed to send approval email to {user.email}")
+            logger.warning(f"Failed to send {description} to {user.email}{for_event}")
         
         return success
         
     except EmailError as e:
-        current_app.logger.error(f"Error sending approval email to {user.email}: {e}")
+        logger.error(f"Error sending {description} to {user.email}{for_event}: {e}")
         return False
 
 
+def _get_base_url() -> str:
+    """
+    Get the site's base URL for links in emails
+    
+    Read from the app config once per app; call _base_url_for.cache_clear()
+    after changing BASE_URL at runtime.
+    """
+    return _base_url_for(current_app._get_current_object())
+
+
+@functools.lru_cache(maxsize=4)
+def _base_url_for(app) -> str:
+    return app.config.get('BASE_URL', 'https://cosypolyamory.org')
+
+
+def notify_application_approved(user):
+    """
+    Send approval notification email to a user
+    
+    Args:
+        user: User model instance with approved application
+    """
+    return _notify_user(user, "application_approved", "approval email",
+                        base_url=_get_base_url())
+
+
 def notify_application_rejected(user, rejection_reason=None):
     """
     Send rejection notification email to a user
@@ -167,24 +542,8 @@ def notify_application_rejected(user, rejection_reason=None):
         user: User model instance with rejected application
         rejection_reason: Optional reason for rejection
     """
-    try:
-        success = send_notification_email(
-            to_email=user.email,
-            template_name="application_rejected",
-            name=user.name,
-            rejection_reason=rejection_reason
-        )
-        
-        if success:
-            current_app.logger.info(f"Rejection email sent to {user.email}")
-        else:
-            current_app.logger.warning(f"Failed to send rejection email to {user.email}")
-        
-        return success
-        
-    except EmailError as e:
-        current_app.logger.error(f"Error sending rejection email to {user.email}: {e}")
-        return False
+    return _notify_user(user, "application_rejected", "rejection email",
+                        rejection_reason=rejection_reason)
 
 
 def send_rsvp_confirmation(user, event, rsvp):
@@ -196,31 +555,21 @@ def send_rsvp_confirmation(user, event, rsvp):
         event: Event model instance
         rsvp: RSVP model instance
     """
-    try:
-        success = send_notification_email(
-            to_email=user.email,
-            template_name="rsvp",
-            name=user.name,
-            event_title=event.title,
-            location=event.establishment_name or "Location will be provided to attendees",
-            date=event.date.strftime('%A, %B %d, %Y'),
-            start_time=event.exact_time.strftime('%I:%M %p') if event.exact_time else "TBD",
-            end_time=event.end_time.strftime('%I:%M %p') if event.end_time else None,
-            venue_notes=event.location_notes or "",
-            event_description=event.description or "",
-            event_url=url_for('events.event_detail', event_id=event.id, _external=True)
-        )
-        
-        if success:
-            current_app.logger.info(f"RSVP confirmation sent to {user.email} for event: {event.title}")
-        else:
-            current_app.logger.warning(f"Failed to send RSVP confirmation to {user.email} for event: {event.title}")
-        
-        return success
-        
-    except EmailError as e:
-        current_app.logger.error(f"Error sending RSVP confirmation to {user.email} for event {event.title}: {e}")
+    if not user.email:
         return False
+    
+    event_times = _format_event_times(event)
+    return _notify_user(
+        user, "rsvp", "RSVP confirmation", event=event,
+        event_title=event.title,
+        location=event.establishment_name or "Location will be provided to attendees",
+        date=event_times['event_date'],
+        start_time=event_times['event_time'],
+        end_time=event_times['end_time'],
+        venue_notes=event.location_notes or "",
+        event_description=event.description or "",
+        event_url=_event_url(event)
+    )
 
 
 def send_event_reminder(user, event):
@@ -231,27 +580,43 @@ def send_event_reminder(user, event):
         user: User model instance
         event: Event model instance
     """
+    if not user.email:
+        return False
+    
+    return _notify_user(
+        user, "event_reminder", "event reminder", event=event,
+        event_title=event.title,
+        **_format_event_times(event),
+        event_location=event.establishment_name or "Location will be provided to attendees",
+        venue_notes=event.location_notes or "",
+        event_description=event.description or "Event details available on the website."
+    )
+
+
+def send_event_reminders(users, event) -> list:
+    """
+    Send event reminder emails to all of an event's attendees
+    
+    Args:
+        users: List of User model instances
+        event: Event model instance
+    
+    Returns:
+        list: One bool per user (in the same order) - True if the reminder was sent successfully
+    """
     try:
-        success = send_notification_email(
-            to_email=user.email,
-            template_name="event_reminder",
-            name=user.name,
+        # Not bulk_notify: reminders are sent outside a request, where url_for can't build event_url
+        return send_bulk_notification(users, "event_reminder", dict(
             event_title=event.title,
-            event_date=event.date.strftime('%A, %B %d, %Y'),
-            event_time=event.exact_time.strftime('%I:%M %p') if event.exact_time else "TBD",
+            **_format_event_times(event),
             event_location=event.establishment_name or "Location will be provided to attendees",
             venue_notes=event.location_notes or "",
             event_description=event.description or "Event details available on the website."
-        )
-        
-        if not success:
-            current_app.logger.warning(f"Failed to send event reminder to {user.email} for event: {event.title}")
-        
-        return success
+        ))
         
     except EmailError as e:
-        current_app.logger.error(f"Error sending event reminder to {user.email} for event {event.title}: {e}")
-        return False
+        logger.error(f"Error sending event reminders for event {event.title}: {e}")
+        return [False] * len(users)
 
 
 def send_waitlist_promotion_notification(user, event):
@@ -262,30 +627,18 @@ def send_waitlist_promotion_notification(user, event):
         user: User model instance
         event: Event model instance
     """
-    try:
-        success = send_notification_email(
-            to_email=user.email,
-            template_name="waitlist_promoted",
-            name=user.name,
-            event_title=event.title,
-            event_date=event.date.strftime('%A, %B %d, %Y'),
-            event_time=event.exact_time.strftime('%I:%M %p') if event.exact_time else "TBD",
-            event_location=event.establishment_name or "Location will be provided to attendees",
-            event_description=event.description or "",
-            venue_notes=event.location_notes or "",
-            event_url=url_for('events.event_detail', event_id=event.id, _external=True)
-        )
-        
-        if success:
-            current_app.logger.info(f"Waitlist promotion notification sent to {user.email} for event: {event.title}")
-        else:
-            current_app.logger.warning(f"Failed to send waitlist promotion notification to {user.email} for event: {event.title}")
-        
-        return success
-        
-    except EmailError as e:
-        current_app.logger.error(f"Error sending waitlist promotion notification to {user.email} for event {event.title}: {e}")
+    if not user.email:
         return False
+    
+    return _notify_user(
+        user, "waitlist_promoted", "waitlist promotion notification", event=event,
+        event_title=event.title,
+        **_format_event_times(event),
+        event_location=event.establishment_name or "Location will be provided to attendees",
+        event_description=event.description or "",
+        venue_notes=event.location_notes or "",
+        event_url=_event_url(event)
+    )
 
 
 def send_rsvp_update_notification(user, event, status, reason=None):
@@ -298,31 +651,19 @@ def send_rsvp_update_notification(user, event, status, reason=None):
         status: New RSVP status ('yes', 'no', 'maybe', 'waitlist', 'removed')
         reason: Optional reason for the status change
     """
-    try:
-        success = send_notification_email(
-            to_email=user.email,
-            template_name="rsvp_updated",
-            name=user.name,
-            event_title=event.title,
-            event_date=event.date.strftime('%A, %B %d, %Y'),
-            event_time=event.exact_time.strftime('%I:%M %p') if event.exact_time else "TBD",
-            event_location=event.establishment_name or "Location will be provided to attendees",
-            status=status,
-            reason=reason,
-            venue_notes=event.location_notes or "",
-            event_url=url_for('events.event_detail', event_id=event.id, _external=True)
-        )
-        
-        if success:
-            current_app.logger.info(f"RSVP update notification sent to {user.email} for event: {event.title} (status: {status})")
-        else:
-            current_app.logger.warning(f"Failed to send RSVP update notification to {user.email} for event: {event.title} (status: {status})")
-        
-        return success
-        
-    except EmailError as e:
-        current_app.logger.error(f"Error sending RSVP update notification to {user.email} for event {event.title}: {e}")
+    if not user.email:
         return False
+    
+    return _notify_user(
+        user, "rsvp_updated", f"RSVP update notification (status: {status})", event=event,
+        event_title=event.title,
+        **_format_event_times(event),
+        event_location=event.establishment_name or "Location will be provided to attendees",
+        status=status,
+        reason=reason,
+        venue_notes=event.location_notes or "",
+        event_url=_event_url(event)
+    )
 
 
 def notify_host_assigned(user, event, role="host"):
@@ -334,27 +675,17 @@ def notify_host_assigned(user, event, role="host"):
         event: Event model instance
         role: Role assigned ("host" or "co-host")
     """
-    try:
-        success = send_notification_email(
-            to_email=user.email,
-            template_name="host_assigned",
-            name=user.name,
-            role=role,
-            event_title=event.title,
-            event_date=event.date.strftime('%A, %B %d, %Y'),
-            event_time=event.exact_time.strftime('%I:%M %p') if event.exact_time else "TBD",
-            event_location=event.establishment_name or "Location TBD",
-            event_url=url_for('events.event_detail', event_id=event.id, _external=True)
-        )
-        
-        if success:
-            current_app.logger.info(f"Host assignment notification sent to {user.email} for event: {event.title}")
-        
-        return success
-        
-    except EmailError as e:
-        current_app.logger.error(f"Error sending host assignment notification to {user.email}: {e}")
+    if not user.email:
         return False
+    
+    return _notify_user(
+        user, "host_assigned", "host assignment notification", event=event,
+        role=role,
+        event_title=event.title,
+        **_format_event_times(event),
+        event_location=event.establishment_name or "Location TBD",
+        event_url=_event_url(event)
+    )
 
 
 def notify_host_removed(user, event, role="host"):
@@ -366,61 +697,21 @@ def notify_host_removed(user, event, role="host"):
         event: Event model instance
         role: Role removed from ("host" or "co-host")
     """
-    try:
-        success = send_notification_email(
-            to_email=user.email,
-            template_name="host_removed",
-            name=user.name,
-            role=role,
-            event_title=event.title,
-            event_date=event.date.strftime('%A, %B %d, %Y'),
-            event_time=event.exact_time.strftime('%I:%M %p') if event.exact_time else "TBD",
-            event_location=event.establishment_name or "Location TBD",
-            event_url=url_for('events.event_detail', event_id=event.id, _external=True)
-        )
-        
-        if success:
-            current_app.logger.info(f"Host removal notification sent to {user.email} for event: {event.title}")
-        
-        return success
-        
-    except EmailError as e:
-        current_app.logger.error(f"Error sending host removal notification to {user.email}: {e}")
+    if not user.email:
         return False
+    
+    return _notify_user(
+        user, "host_removed", "host removal notification", event=event,
+        role=role,
+        event_title=event.title,
+        **_format_event_times(event),
+        event_location=event.establishment_name or "Location TBD",
+        event_url=_event_url(event)
+    )
 
 
-def notify_rsvp_updated(user, event, status, reason=None):
-    """
-    Send notification when user's RSVP is removed or waitlisted
-    
-    Args:
-        user: User model instance
-        event: Event model instance
-        status: New status ("removed" or "waitlisted")
-        reason: Optional reason for the change
-    """
-    try:
-        success = send_notification_email(
-            to_email=user.email,
-            template_name="rsvp_updated",
-            name=user.name,
-            status=status,
-            event_title=event.title,
-            event_date=event.date.strftime('%A, %B %d, %Y'),
-            event_time=event.exact_time.strftime('%I:%M %p') if event.exact_time else "TBD",
-            event_location=event.establishment_name or "Location TBD",
-            reason=reason,
-            event_url=url_for('events.event_detail', event_id=event.id, _external=True)
-        )
-        
-        if success:
-            current_app.logger.info(f"RSVP update notification sent to {user.email} for event: {event.title}")
-        
-        return success
-        
-    except EmailError as e:
-        current_app.logger.error(f"Error sending RSVP update notification to {user.email}: {e}")
-        return False
+# Former duplicate of send_rsvp_update_notification, kept for existing callers
+notify_rsvp_updated = send_rsvp_update_notification
 
 
 def notify_event_updated(user, event, changes=None, update_message=None):
@@ -433,28 +724,18 @@ def notify_event_updated(user, event, changes=None, update_message=None):
         changes: List of changes made to the event
         update_message: Optional message from organizers
     """
-    try:
-        success = send_notification_email(
-            to_email=user.email,
-            template_name="event_updated",
-            name=user.name,
-            event_title=event.title,
-            event_date=event.date.strftime('%A, %B %d, %Y'),
-            event_time=event.exact_time.strftime('%I:%M %p') if event.exact_time else "TBD",
-            event_location=event.establishment_name or "Location TBD",
-            changes=changes or [],
-            update_message=update_message,
-            event_url=url_for('events.event_detail', event_id=event.id, _external=True)
-        )
-        
-        if success:
-            current_app.logger.info(f"Event update notification sent to {user.email} for event: {event.title}")
-        
-        return success
-        
-    except EmailError as e:
-        current_app.logger.error(f"Error sending event update notification to {user.email}: {e}")
+    if not user.email:
         return False
+    
+    return _notify_user(
+        user, "event_updated", "event update notification", event=event,
+        event_title=event.title,
+        **_format_event_times(event),
+        event_location=event.establishment_name or "Location TBD",
+        changes=changes or [],
+        update_message=update_message,
+        event_url=_event_url(event)
+    )
 
 
 def notify_account_created(user):
@@ -464,24 +745,8 @@ def notify_account_created(user):
     Args:
         user: User model instance for the new account
     """
-    try:
-        success = send_notification_email(
-            to_email=user.email,
-            template_name="account_created",
-            name=user.name,
-            base_url=current_app.config.get('BASE_URL', 'https://cosypolyamory.org')
-        )
-        
-        if success:
-            current_app.logger.info(f"Welcome email sent to {user.email}")
-        else:
-            current_app.logger.warning(f"Failed to send welcome email to {user.email}")
-        
-        return success
-        
-    except EmailError as e:
-        current_app.logger.error(f"Error sending welcome email to {user.email}: {e}")
-        return False
+    return _notify_user(user, "account_created", "welcome email",
+                        base_url=_get_base_url())
 
 
 def notify_application_submitted(user):
@@ -491,24 +756,8 @@ def notify_application_submitted(user):
     Args:
         user: User model instance who submitted the application
     """
-    try:
-        success = send_notification_email(
-            to_email=user.email,
-            template_name="application_submitted",
-            name=user.name,
-            base_url=current_app.config.get('BASE_URL', 'https://cosypolyamory.org')
-        )
-        
-        if success:
-            current_app.logger.info(f"Application confirmation email sent to {user.email}")
-        else:
-            current_app.logger.warning(f"Failed to send application confirmation email to {user.email}")
-        
-        return success
-        
-    except EmailError as e:
-        current_app.logger.error(f"Error sending application confirmation email to {user.email}: {e}")
-        return False
+    return _notify_user(user, "application_submitted", "application confirmation email",
+                        base_url=_get_base_url())
 
 
 def notify_organizers_new_application(user):
@@ -518,53 +767,48 @@ def notify_organizers_new_application(user):
     Args:
         user: User model instance who submitted the application
     """
-    from cosypolyamory.models.user import User
-    from cosypolyamory.models.user_application import UserApplication
-    from datetime import datetime
-    
     try:
         # Get the user's application
         application = UserApplication.get(UserApplication.user == user)
         questions_and_answers = application.get_questions_and_answers()
         
-        # Get all organizers and admins
-        organizers = User.select().where(User.role.in_(['admin', 'organizer']))
+        # Get all organizers and admins (only the fields the email needs)
+        organizers = list(User.select(User.id, User.email, User.name).where(User.role.in_(['admin', 'organizer'])))
         
-        success_count = 0
-        total_count = 0
+        # The email content is the same for every organizer, so it is rendered once
+        template_vars = dict(
+            applicant_name=user.name,
+            applicant_pronouns=user.pronouns,
+            submission_date=datetime.now().strftime('%B %d, %Y at %I:%M %p'),
+            questions_and_answers=questions_and_answers,
+            base_url=_get_base_url()
+        )
         
-        for organizer in organizers:
-            try:
-                total_count += 1
-                success = send_notification_email(
-                    to_email=organizer.email,
-                    template_name="organizer_new_application",
-                    applicant_name=user.name,
-                    applicant_pronouns=user.pronouns,
-                    submission_date=datetime.now().strftime('%B %d, %Y at %I:%M %p'),
-                    questions_and_answers=questions_and_answers,
-                    base_url=current_app.config.get('BASE_URL', 'https://cosypolyamory.org')
-                )
-                
-                if success:
-                    success_count += 1
-                    current_app.logger.info(f"New application notification sent to organizer {organizer.email}")
-                else:
-                    current_app.logger.warning(f"Failed to send new application notification to organizer {organizer.email}")
-                    
-            except EmailError as e:
-                current_app.logger.error(f"Error sending new application notification to organizer {organizer.email}: {e}")
-            except Exception as e:
-                current_app.logger.error(f"Unexpected error sending new application notification to organizer {organizer.email}: {e}")
+        try:
+            results = send_bulk_notification(organizers, "organizer_new_application", template_vars)
+        except EmailError as e:
+            logger.error(f"Error sending new application notifications to organizers: {e}")
+            results = [False] * len(organizers)
+        
+        log_successes = logger.isEnabledFor(logging.INFO)
+        for organizer, success in zip(organizers, results):
+            if success:
+                if log_successes:
+                    logger.info(f"New application notification sent to organizer {organizer.email}")
+            else:
+                logger.warning(f"Failed to send new application notification to organizer {organizer.email}")
         
-        current_app.logger.info(f"New application notifications: {success_count}/{total_count} sent successfully for user {user.email}")
+        success_count = sum(results)
+        total_count = len(organizers)
+        
+        logger.info(f"New application notifications: {success_count}/{total_count} sent successfully for user {user.email}")
         return success_count > 0
         
     except UserApplication.DoesNotExist:
-        current_app.logger.error(f"Application not found for user {user.email} when trying to notify organizers")
+        logger.error(f"Application not found for user {user.email} when trying to notify organizers")
         return False
     except Exception as e:
-        current_app.logger.error(f"Error getting application data for organizer notification: {e}")
+        logger.error(f"Error getting application data for organizer notification: {e}")
         return False
 
 
@@ -579,29 +823,19 @@ def notify_event_cancelled(user, event, cancellation_reason=None, reschedule_inf
         reschedule_info: Information about rescheduling
         contact_info: Contact information for questions
     """
-    try:
-        success = send_notification_email(
-            to_email=user.email,
-            template_name="event_cancelled",
-            name=user.name,
-            event_title=event.title,
-            event_date=event.date.strftime('%A, %B %d, %Y'),
-            event_time=event.exact_time.strftime('%I:%M %p') if event.exact_time else "TBD",
-            event_location=event.establishment_name,
-            cancellation_reason=cancellation_reason,
-            reschedule_info=reschedule_info,
-            contact_info=contact_info,
-            base_url=current_app.config.get('BASE_URL', 'https://cosypolyamory.org')
-        )
-        
-        if success:
-            current_app.logger.info(f"Event cancellation notification sent to {user.email} for event: {event.title}")
-        
-        return success
-        
-    except EmailError as e:
-        current_app.logger.error(f"Error sending event cancellation notification to {user.email}: {e}")
+    if not user.email:
         return False
+    
+    return _notify_user(
+        user, "event_cancelled", "event cancellation notification", event=event,
+        event_title=event.title,
+        **_format_event_times(event),
+        event_location=event.establishment_name,
+        cancellation_reason=cancellation_reason,
+        reschedule_info=reschedule_info,
+        contact_info=contact_info,
+        base_url=_get_base_url()
+    )
 
 
 def notify_event_published(event):
@@ -614,40 +848,31 @@ def notify_event_published(event):
     Returns:
         int: Number of notifications successfully sent
     """
-    from cosypolyamory.models.user import User
-    from flask import url_for
-    
     try:
         # Get all users who should receive the notification
-        eligible_users = User.select().where(User.role.in_(['admin', 'organizer', 'approved']))
+        eligible_users = list(User.select().where(User.role.in_(['admin', 'organizer', 'approved'])))
         
-        success_count = 0
-        for user in eligible_users:
-            try:
-                success = send_notification_email(
-                    to_email=user.email,
-                    template_name="new_event",
-                    name=user.name,
-                    event_title=event.title,
-                    event_date=event.date.strftime('%A, %B %d, %Y'),
-                    event_time=event.exact_time.strftime('%I:%M %p') if event.exact_time else "TBD",
-                    event_location=event.establishment_name,
-                    event_description=event.description,
-                    event_url=url_for('events.event_detail', event_id=event.id, _external=True),
-                    base_url=current_app.config.get('BASE_URL', 'https://cosypolyamory.org')
-                )
-                
-                if success:
-                    success_count += 1
-                    
-            except Exception as e:
-                current_app.logger.error(f"Failed to send new event notification to {user.email}: {e}")
-                continue
+        event_vars = dict(
+            event_title=event.title,
+            **_format_event_times(event),
+            event_location=event.establishment_name,
+            event_description=event.description,
+            event_url=_event_url(event),
+            base_url=_get_base_url()
+        )
+        
+        results = send_bulk_notification(eligible_users, "new_event", event_vars)
+        
+        for user, success in zip(eligible_users, results):
+            if not success:
+                logger.error(f"Failed to send new event notification to {user.email}")
+        
+        success_count = sum(results)
         
-        current_app.logger.info(f"New event notification sent to {success_count} users for event: {event.title}")
+        logger.info(f"New event notification sent to {success_count} users for event: {event.title}")
         return success_count
         
     except Exception as e:
-        current_app.logger.error(f"Error sending new event notifications for {event.title}: {e}")
+        logger.error(f"Error sending new event notifications for {event.title}: {e}")
         return 0
 
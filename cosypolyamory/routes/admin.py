@@ -5,9 +5,11 @@ Handles administrative interface and management functionality.
 """
 
 import os
+import time
 from datetime import datetime
 from flask import Blueprint, render_template, request, redirect, url_for, flash
 from flask_login import login_required, current_user
+from peewee import fn, SQL, IntegrityError, Case
 
 from cosypolyamory.models.user import User
 from cosypolyamory.models.user_application import UserApplication
@@ -15,10 +17,48 @@ from cosypolyamory.models.event_note import EventNote
 from cosypolyamory.models.event import Event
 from cosypolyamory.database import database
 from cosypolyamory.decorators import organizer_required, admin_or_organizer_required
-from cosypolyamory.notification import notify_application_approved, notify_application_rejected
+from cosypolyamory.notification import notify_application_approved, notify_application_rejected, send_in_background
+from cosypolyamory.routes.api.admin import invalidate_admin_user_lists
 
 bp = Blueprint('admin', __name__, url_prefix='/admin')
 
+# Columns touched when an application is approved or rejected
+_REVIEW_FIELDS = [UserApplication.reviewed_at, UserApplication.reviewed_by, UserApplication.review_notes]
+_USER_STATUS_FIELDS = [User.role, User.is_approved]
+
+# Number of applications awaiting review, cached for the dashboard banner
+_PENDING_COUNT_TTL = 30  # seconds
+_pending_count_cache = {'value': None, 'expires': 0.0}
+
+
+def _set_pending_applications_count(count):
+    """Cache a freshly computed pending applications count"""
+    _pending_count_cache['value'] = count
+    _pending_count_cache['expires'] = time.monotonic() + _PENDING_COUNT_TTL
+
+
+def _invalidate_pending_applications_count():
+    """Force the next read to recount, e.g. after an application is reviewed"""
+    _pending_count_cache['expires'] = 0.0
+
+
+def _get_pending_applications_count():
+    """
+    Get the number of applications from users with the pending role
+    
+    The count is cached per process for _PENDING_COUNT_TTL seconds; reviews
+    made here invalidate it, other role changes show up once it expires.
+    """
+    if time.monotonic() < _pending_count_cache['expires']:
+        return _pending_count_cache['value']
+    
+    count = (UserApplication.select()
+             .join(User, on=UserApplication.user)
+             .where(User.role == "pending")
+             .count())
+    _set_pending_applications_count(count)
+    return count
+
 # Moderation Routes
 @bp.route('/moderate')
 @organizer_required
@@ -27,16 +67,26 @@ def moderate_applications():
     page = request.args.get('page', 1, type=int)
     per_page = 10
     
-    # Get paginated pending applications (applications from users with pending/new status)
-    pending_applications_query = (UserApplication.select()
-                                 .join(User)
+    # Get paginated pending applications (applications from users with pending/new status),
+    # loading each applicant and the total count in the same query
+    pending_applications_query = (UserApplication.select(UserApplication, User,
+                                                         fn.COUNT(SQL('*')).over().alias('total_count'))
+                                 .join(User, on=UserApplication.user)
                                  .where(User.role == "pending")
-                                 .order_by(UserApplication.submitted_at))
-    total_applications = pending_applications_query.count()
+                                 # id breaks submitted_at ties so rows never repeat or vanish across pages
+                                 .order_by(UserApplication.submitted_at, UserApplication.id))
     
     # Calculate pagination
     offset = (page - 1) * per_page
     pending_applications = list(pending_applications_query.offset(offset).limit(per_page))
+    if pending_applications:
+        total_applications = pending_applications[0].total_count
+    elif page > 1:
+        # Past the last page - no rows to read the total from
+        total_applications = pending_applications_query.count()
+    else:
+        total_applications = 0
+    _set_pending_applications_count(total_applications)
     
     # Calculate pagination info
     total_pages = (total_applications + per_page - 1) // per_page
@@ -65,22 +115,30 @@ def approve_application(application_id):
     """Approve a user application"""
     try:
         with database.atomic():
-            application = UserApplication.get_by_id(application_id)
+            application = (UserApplication.select(UserApplication, User)
+                           .join(User, on=UserApplication.user)
+                           .where(UserApplication.id == application_id)
+                           .get())
             application.reviewed_at = datetime.now()
             application.reviewed_by = current_user
             application.review_notes = request.form.get('notes', '')
-            application.save()
+            # Write only the review columns rather than every column of the row
+            application.save(only=_REVIEW_FIELDS)
             
             # Update user status
             user = application.user
             user.role = 'approved'
             user.is_approved = True
-            user.save()
+            user.save(only=_USER_STATUS_FIELDS)
             
-        # Send approval email notification
+        # Recount once the review is committed
+        _invalidate_pending_applications_count()
+        invalidate_admin_user_lists()
+        
+        # Send approval email notification off the request thread
         try:
-            notify_application_approved(user)
-            flash(f'Application for {user.name} has been approved and notification email sent.', 'success')
+            send_in_background(notify_application_approved, user)
+            flash(f'Application for {user.name} has been approved and notification email queued.', 'success')
         except Exception as email_error:
             flash(f'Application for {user.name} has been approved, but email notification failed: {str(email_error)}', 'warning')
             
@@ -95,22 +153,29 @@ def reject_application(application_id):
     """Reject a user application"""
     try:
         with database.atomic():
-            application = UserApplication.get_by_id(application_id)
+            application = (UserApplication.select(UserApplication, User)
+                           .join(User, on=UserApplication.user)
+                           .where(UserApplication.id == application_id)
+                           .get())
             application.reviewed_at = datetime.now()
             application.reviewed_by = current_user
             application.review_notes = request.form.get('admin_notes', '')
-            application.save()
+            application.save(only=_REVIEW_FIELDS)
 
             # Update user status
             user = application.user
             user.role = "rejected"
             user.is_approved = False
-            user.save()
+            user.save(only=_USER_STATUS_FIELDS)
             
-        # Send rejection email notification with reason
+        # Recount once the review is committed
+        _invalidate_pending_applications_count()
+        invalidate_admin_user_lists()
+        
+        # Send rejection email notification with reason off the request thread
         try:
-            notify_application_rejected(user, rejection_reason=application.review_notes)
-            flash(f'Application for {application.user.name} has been rejected and notification email sent.', 'info')
+            send_in_background(notify_application_rejected, user, rejection_reason=application.review_notes)
+            flash(f'Application for {application.user.name} has been rejected and notification email queued.', 'info')
         except Exception as email_error:
             flash(f'Application for {application.user.name} has been rejected, but email notification failed: {str(email_error)}', 'warning')
             
@@ -126,16 +191,11 @@ def reject_application(application_id):
 @admin_or_organizer_required
 def admin_dashboard():
     """Admin dashboard"""
-    users = list(User.select())
-    
+    # User lists are loaded page by page from /api/admin/users/<role>
     # Calculate pending applications count for the notification message
-    pending_applications_count = (UserApplication.select()
-                                 .join(User)
-                                 .where(User.role == "pending")
-                                 .count())
+    pending_applications_count = _get_pending_applications_count()
     
     return render_template('admin/admin.html', 
-                         users=users, 
                          pending_applications_count=pending_applications_count)
 
 # Event Notes Admin Routes (admins and organizers only)
@@ -157,13 +217,13 @@ def add_event_note():
                 if not name or not note:
                     flash('Both name and note are required.', 'error')
                     return render_template('events/add_event_note.html')
-                # Check for duplicate name
-                if EventNote.select().where(EventNote.name == name).exists():
-                    flash('A note with this name already exists.', 'error')
-                    return render_template('events/add_event_note.html')
                 EventNote.create(name=name, note=note)
                 flash('Event note added successfully.', 'success')
                 return redirect(url_for('admin.event_notes'))
+        except IntegrityError:
+            # EventNote.name is unique, so a duplicate fails the insert itself
+            flash('A note with this name already exists.', 'error')
+            return render_template('events/add_event_note.html')
         except Exception as e:
             flash(f'Error adding event note: {str(e)}', 'error')
             return render_template('events/add_event_note.html')
@@ -187,17 +247,16 @@ def edit_event_note(note_id):
         
         try:
             with database.atomic():
-                # Check for duplicate name (excluding self)
-                if EventNote.select().where((EventNote.name == name) & (EventNote.id != note.id)).exists():
-                    flash('A note with this name already exists.', 'error')
-                    return render_template('events/edit_event_note.html', note=note)
-                
                 note.name = name
                 note.note = note_text
                 note.save()
                 
             flash('Event note updated successfully.', 'success')
             return redirect(url_for('admin.event_notes'))
+        except IntegrityError:
+            # EventNote.name is unique, so renaming onto another note fails the update
+            flash('A note with this name already exists.', 'error')
+            return render_template('events/edit_event_note.html', note=note)
         except Exception as e:
             flash(f'Error updating event note: {str(e)}', 'error')
             return render_template('events/edit_event_note.html', note=note)
@@ -215,11 +274,11 @@ def delete_event_note(note_id):
     
     try:
         with database.atomic():
-            # Check if the note is being used by any events
-            from cosypolyamory.models.event import Event
-            events_using_note = list(Event.select().where(Event.event_note == note))
+            # Check if the note is being used by any events; titles are only
+            # fetched when the delete is blocked
+            events_using_note = Event.select(Event.title).where(Event.event_note == note)
             
-            if events_using_note:
+            if events_using_note.exists():
                 event_titles = [event.title for event in events_using_note]
                 flash(f'Cannot delete note "{note.name}" because it is being used by the following events: {", ".join(event_titles)}', 'error')
                 return redirect(url_for('admin.event_notes'))
@@ -234,241 +293,272 @@ def delete_event_note(note_id):
         
     return redirect(url_for('admin.event_notes'))
 
-@bp.route('/community-insights')
-@organizer_required
-def community_insights():
-    """Community statistics and insights for organizers/admins"""
-    try:
-        from cosypolyamory.models.user import User
-        from datetime import timedelta
-        
-        # Get all approved users with pronouns
-        approved_users = (User
-                         .select()
-                         .where(
-                             (User.role.in_(['approved', 'admin', 'organizer'])) &
-                             (User.pronouns.is_null(False))
-                         ))
-        
-        # Calculate pronoun statistics for all approved users
-        # Extract first two words only for graphing (e.g., "they/them" from "they/them/theirs")
-        # Normalize to lowercase for consistent grouping
-        pronoun_counts = {}
-        
-        for user in approved_users:
-            if user.pronouns:
-                pronouns = user.pronouns.strip().lower()
-                # Split by slash and take only first two words
-                parts = pronouns.split('/')
-                if len(parts) >= 2:
-                    # Use first two words for the graph
-                    graph_pronouns = f"{parts[0]}/{parts[1]}"
-                else:
-                    # If only one word, use as-is (shouldn't happen with validation)
-                    graph_pronouns = pronouns
-                pronoun_counts[graph_pronouns] = pronoun_counts.get(graph_pronouns, 0) + 1
-        
-        pronoun_stats = {
-            'pronouns': pronoun_counts
-        }
-        
-        # Get total user counts by role
-        total_approved = User.select().where(User.role == 'approved').count()
-        total_organizers = User.select().where(User.role == 'organizer').count()
-        total_admins = User.select().where(User.role == 'admin').count()
-        total_pending = User.select().where(User.role == 'pending').count()
-        total_users_with_pronouns = approved_users.count()
-        
-        community_stats = {
-            'total_approved': total_approved,
-            'total_organizers': total_organizers, 
-            'total_admins': total_admins,
-            'total_pending': total_pending,
-            'total_users_with_pronouns': total_users_with_pronouns,
-            'total_community_members': total_approved + total_organizers + total_admins
-        }
-        
-        # Calculate user growth statistics - get all time data
-        # We'll calculate monthly data points from the earliest user to now
-        user_growth_data = []
-        today = datetime.now().date()
-        
-        # Find the earliest user creation date
-        earliest_user = User.select(User.created_at).order_by(User.created_at.asc()).first()
-        if earliest_user and earliest_user.created_at:
-            earliest_date = earliest_user.created_at
-            # Calculate how many months to go back (only to when data exists)
-            months_diff = (today.year - earliest_date.year) * 12 + (today.month - earliest_date.month)
-            max_months = months_diff  # Only go back to when data exists
+# Community insights are expensive aggregates over most tables, so each
+# process serves a snapshot and recomputes it at most every few minutes
+_INSIGHTS_TTL = 300  # seconds
+_insights_cache = {'value': None, 'expires': 0.0}
+
+
+def _compute_community_insights():
+    """
+    Compute every statistic shown on the community insights page
+    
+    Returns:
+        dict: Template variables for admin/community_insights.html
+    """
+    from cosypolyamory.models.user import User
+    from datetime import timedelta
+    
+    # One reference time for every statistic in the snapshot
+    now = datetime.now()
+    today = now.date()
+    
+    # Count approved users per distinct pronoun string in the database
+    pronoun_rows = (User
+                    .select(User.pronouns, fn.COUNT(User.id).alias('user_count'))
+                    .where(
+                        (User.role.in_(['approved', 'admin', 'organizer'])) &
+                        (User.pronouns.is_null(False))
+                    )
+                    .group_by(User.pronouns)
+                    .tuples())
+    
+    # Calculate pronoun statistics for all approved users
+    # Extract first two words only for graphing (e.g., "they/them" from "they/them/theirs")
+    # Normalize to lowercase for consistent grouping
+    pronoun_counts = {}
+    total_users_with_pronouns = 0
+    
+    for pronouns, user_count in pronoun_rows:
+        total_users_with_pronouns += user_count
+        if pronouns:
+            pronouns = pronouns.strip().lower()
+            # Split by slash and take only first two words
+            parts = pronouns.split('/')
+            if len(parts) >= 2:
+                # Use first two words for the graph
+                graph_pronouns = f"{parts[0]}/{parts[1]}"
+            else:
+                # If only one word, use as-is (shouldn't happen with validation)
+                graph_pronouns = pronouns
+            pronoun_counts[graph_pronouns] = pronoun_counts.get(graph_pronouns, 0) + user_count
+    
+    pronoun_stats = {
+        'pronouns': pronoun_counts
+    }
+    
+    # Get total user counts by role
+    role_counts = dict(User
+                       .select(User.role, fn.COUNT(User.id))
+                       .group_by(User.role)
+                       .tuples())
+    total_approved = role_counts.get('approved', 0)
+    total_organizers = role_counts.get('organizer', 0)
+    total_admins = role_counts.get('admin', 0)
+    total_pending = role_counts.get('pending', 0)
+    
+    community_stats = {
+        'total_approved': total_approved,
+        'total_organizers': total_organizers, 
+        'total_admins': total_admins,
+        'total_pending': total_pending,
+        'total_users_with_pronouns': total_users_with_pronouns,
+        'total_community_members': total_approved + total_organizers + total_admins
+    }
+    
+    # Calculate user growth statistics - get all time data
+    # We'll calculate monthly data points from the earliest user to now
+    user_growth_data = []
+    
+    # New registrations per calendar month, split by role, in one query
+    created_month = fn.strftime('%Y-%m', User.created_at)
+    registration_rows = list(User
+        .select(
+            created_month.alias('month'),
+            fn.COUNT(User.id).alias('registered'),
+            fn.SUM(Case(None, [(User.role.in_(['pending', 'approved', 'organizer', 'admin', 'rejected']), 1)], 0)).alias('with_applications'),
+            fn.SUM(Case(None, [(User.role.in_(['approved', 'organizer', 'admin']), 1)], 0)).alias('approved'))
+        .where(User.created_at.is_null(False))
+        .group_by(created_month)
+        .order_by(created_month)
+        .tuples())
+    
+    # Active users per past month. Each past data point is taken on the
+    # 1st of the month, and a last_login counts if it falls in the two
+    # weeks before it; months are longer than two weeks, so each login
+    # belongs to at most one data point: the 1st following it, if that is
+    # within 14 days.
+    login_cutoff = fn.datetime(User.last_login, '+14 days', 'start of month')
+    active_by_month = dict(User
+        .select(fn.strftime('%Y-%m', login_cutoff), fn.COUNT(User.id))
+        .where(
+            (login_cutoff >= User.last_login) &
+            (User.created_at <= login_cutoff)
+        )
+        .group_by(fn.strftime('%Y-%m', login_cutoff))
+        .tuples())
+    
+    # Calculate how many months to go back (only to when data exists)
+    if registration_rows:
+        earliest_year, earliest_month = map(int, registration_rows[0][0].split('-'))
+        max_months = (today.year - earliest_year) * 12 + (today.month - earliest_month)
+    else:
+        max_months = 0  # No users, just show current month
+    
+    # Go back to earliest data, month by month, keeping running totals
+    total_registered = total_with_applications = total_approved_at_date = 0
+    next_row = 0
+    for months_ago in range(max_months, -1, -1):
+        # Calculate the date for this data point (end of month)
+        if months_ago == 0:
+            # Current month - use today
+            cutoff_date = now
+            month_label = cutoff_date.strftime('%b %Y')
         else:
-            max_months = 0  # No users, just show current month
+            # Previous months - use first day of that many months ago
+            year = today.year
+            month = today.month - months_ago
+            while month <= 0:
+                month += 12
+                year -= 1
+            cutoff_date = datetime(year, month, 1)
+            month_label = cutoff_date.strftime('%b %Y')
         
-        # Go back to earliest data, month by month
-        for months_ago in range(max_months, -1, -1):
-            # Calculate the date for this data point (end of month)
-            if months_ago == 0:
-                # Current month - use today
-                cutoff_date = datetime.now()
-                month_label = cutoff_date.strftime('%b %Y')
-            else:
-                # Previous months - use first day of that many months ago
-                year = today.year
-                month = today.month - months_ago
-                while month <= 0:
-                    month += 12
-                    year -= 1
-                cutoff_date = datetime(year, month, 1)
-                month_label = cutoff_date.strftime('%b %Y')
-            
-            # Total registered users (all users created before cutoff)
-            total_registered = User.select().where(
-                User.created_at <= cutoff_date
-            ).count()
-            
-            # Total users with applications submitted
-            total_with_applications = User.select().where(
-                (User.created_at <= cutoff_date) &
-                (User.role.in_(['pending', 'approved', 'organizer', 'admin', 'rejected']))
-            ).count()
-            
-            # Total approved users (approved, organizer, admin roles)
-            total_approved_at_date = User.select().where(
-                (User.created_at <= cutoff_date) &
-                (User.role.in_(['approved', 'organizer', 'admin']))
-            ).count()
-            
-            # Active users (logged in within last 2 weeks from cutoff date)
-            two_weeks_before_cutoff = cutoff_date - timedelta(days=14)
+        # Add users registered before the cutoff (every user for the current month)
+        month_key = cutoff_date.strftime('%Y-%m')
+        while next_row < len(registration_rows) and (
+                months_ago == 0 or registration_rows[next_row][0] < month_key):
+            _, registered, with_applications, approved = registration_rows[next_row]
+            total_registered += registered
+            total_with_applications += with_applications
+            total_approved_at_date += approved
+            next_row += 1
+        
+        # Active users (logged in within last 2 weeks from cutoff date)
+        if months_ago == 0:
             active_users = User.select().where(
                 (User.created_at <= cutoff_date) &
-                (User.last_login >= two_weeks_before_cutoff) &
+                (User.last_login >= cutoff_date - timedelta(days=14)) &
                 (User.last_login <= cutoff_date)
             ).count()
-            
-            user_growth_data.append({
-                'month': month_label,
-                'total_registered': total_registered,
-                'total_with_applications': total_with_applications,
-                'total_approved': total_approved_at_date,
-                'active_users': active_users
-            })
-        
-        # Calculate attendance and hosting statistics
-        from cosypolyamory.models.rsvp import RSVP
-        from cosypolyamory.models.no_show import NoShow
-        from peewee import fn
-        
-        # Top Attendees: Users with most "yes" RSVPs to past events (excluding events they hosted/co-hosted)
-        top_attendees_query = (User
-            .select(User, fn.COUNT(RSVP.id).alias('attendance_count'))
-            .join(RSVP, on=(User.id == RSVP.user))
-            .join(Event, on=(RSVP.event == Event.id))
-            .where(
-                (User.role.in_(['approved', 'admin', 'organizer'])) &
-                (RSVP.status == 'yes') &
-                (Event.exact_time < datetime.now()) &  # Only count past events
-                (Event.organizer != User.id) &  # Exclude events they organized
-                ((Event.co_host.is_null(True)) | (Event.co_host != User.id))  # Exclude events they co-hosted
-            )
-            .group_by(User.id)
-            .order_by(fn.COUNT(RSVP.id).desc())
-            .limit(10))
-        
-        top_attendees = []
-        try:
-            for user_data in top_attendees_query:
-                top_attendees.append({
-                    'name': user_data.name,
-                    'count': user_data.attendance_count,
-                    'role': user_data.role
-                })
-        except Exception as e:
-            print(f"Error calculating top attendees: {e}")
-        
-        # Top Organizers: Users who have hosted/co-hosted the most past events
-        # Count both organizing and co-hosting as equal
-        from peewee import Case, JOIN
-        
-        # Query for organizers (main hosts)
-        organizer_counts = (User
-            .select(User.id, User.name, User.role, fn.COUNT(Event.id).alias('host_count'))
-            .join(Event, on=(User.id == Event.organizer))
-            .where(Event.exact_time < datetime.now())  # Only past events
-            .group_by(User.id, User.name, User.role))
-        
-        # Query for co-hosts  
-        cohost_counts = (User
-            .select(User.id, User.name, User.role, fn.COUNT(Event.id).alias('host_count'))
-            .join(Event, on=(User.id == Event.co_host))
-            .where(Event.exact_time < datetime.now())  # Only past events
-            .group_by(User.id, User.name, User.role))
-        
-        # Combine and sum the counts
-        top_organizers = []
-        try:
-            # Build a dictionary to combine organizer and co-host counts
-            host_stats = {}
-            
-            # Add organizer counts
-            for user_data in organizer_counts:
-                user_id = user_data.id
-                if user_id not in host_stats:
-                    host_stats[user_id] = {
-                        'name': user_data.name,
-                        'role': user_data.role,
-                        'count': 0
-                    }
-                host_stats[user_id]['count'] += user_data.host_count
-            
-            # Add co-host counts
-            for user_data in cohost_counts:
-                user_id = user_data.id
-                if user_id not in host_stats:
-                    host_stats[user_id] = {
-                        'name': user_data.name,
-                        'role': user_data.role,
-                        'count': 0
-                    }
-                host_stats[user_id]['count'] += user_data.host_count
-            
-            # Sort and limit to top 10
-            top_organizers = sorted(host_stats.values(), key=lambda x: x['count'], reverse=True)[:10]
-        except Exception as e:
-            print(f"Error calculating top organizers: {e}")
-        
-        # Top Flakes: Users with most no-shows (unchanged)
-        top_flakes_query = (User
-            .select(User, fn.COUNT(NoShow.id).alias('noshow_count'))
-            .join(NoShow, on=(User.id == NoShow.user))
-            .where(User.role.in_(['approved', 'admin', 'organizer']))
-            .group_by(User.id)
-            .order_by(fn.COUNT(NoShow.id).desc())
-            .limit(10))
+        else:
+            active_users = active_by_month.get(month_key, 0)
         
-        top_flakes = []
+        user_growth_data.append({
+            'month': month_label,
+            'total_registered': total_registered,
+            'total_with_applications': total_with_applications,
+            'total_approved': total_approved_at_date,
+            'active_users': active_users
+        })
+    
+    # Calculate attendance and hosting statistics
+    from cosypolyamory.models.rsvp import RSVP
+    from cosypolyamory.models.no_show import NoShow
+    
+    # Top Attendees: Users with most "yes" RSVPs to past events (excluding events they hosted/co-hosted)
+    top_attendees_query = (User
+        .select(User.name, User.role, fn.COUNT(RSVP.id).alias('attendance_count'))
+        .join(RSVP, on=(User.id == RSVP.user))
+        .join(Event, on=(RSVP.event == Event.id))
+        .where(
+            (User.role.in_(['approved', 'admin', 'organizer'])) &
+            (RSVP.status == 'yes') &
+            (Event.exact_time < now) &  # Only count past events
+            (Event.organizer != User.id) &  # Exclude events they organized
+            ((Event.co_host.is_null(True)) | (Event.co_host != User.id))  # Exclude events they co-hosted
+        )
+        .group_by(User.id)
+        .order_by(fn.COUNT(RSVP.id).desc())
+        .limit(10))
+    
+    top_attendees = []
+    try:
+        for user_data in top_attendees_query:
+            top_attendees.append({
+                'name': user_data.name,
+                'count': user_data.attendance_count,
+                'role': user_data.role
+            })
+    except Exception as e:
+        print(f"Error calculating top attendees: {e}")
+    
+    # Top Organizers: Users who have hosted/co-hosted the most past events
+    # Count both organizing and co-hosting as equal
+    
+    # One row per past event a user hosted, as organizer or as co-host
+    past_events = Event.exact_time < now
+    hosted_events = (
+        Event.select(Event.organizer.alias('host_id')).where(past_events) +
+        Event.select(Event.co_host.alias('host_id')).where(past_events & Event.co_host.is_null(False))
+    ).alias('hosted_events')
+    
+    # Sum both roles per user and keep the top 10 in the database
+    top_organizers_query = (User
+        .select(User.name, User.role, fn.COUNT(SQL('*')).alias('host_count'))
+        .join(hosted_events, on=(User.id == hosted_events.c.host_id))
+        .group_by(User.id, User.name, User.role)
+        .order_by(fn.COUNT(SQL('*')).desc())
+        .limit(10))
+    
+    top_organizers = []
+    try:
+        for user_data in top_organizers_query:
+            top_organizers.append({
+                'name': user_data.name,
+                'role': user_data.role,
+                'count': user_data.host_count
+            })
+    except Exception as e:
+        print(f"Error calculating top organizers: {e}")
+    
+    # Top Flakes: Users with most no-shows (unchanged)
+    top_flakes_query = (User
+        .select(User.name, User.role, fn.COUNT(NoShow.id).alias('noshow_count'))
+        .join(NoShow, on=(User.id == NoShow.user))
+        .where(User.role.in_(['approved', 'admin', 'organizer']))
+        .group_by(User.id)
+        .order_by(fn.COUNT(NoShow.id).desc())
+        .limit(10))
+    
+    top_flakes = []
+    try:
+        for user_data in top_flakes_query:
+            top_flakes.append({
+                'name': user_data.name,
+                'count': user_data.noshow_count,
+                'role': user_data.role
+            })
+    except Exception as e:
+        print(f"Error calculating top flakes: {e}")
+    
+    return {
+        'pronoun_stats': pronoun_stats,
+        'community_stats': community_stats,
+        'top_attendees': top_attendees,
+        'top_organizers': top_organizers,
+        'top_flakes': top_flakes,
+        'user_growth_data': user_growth_data
+    }
+
+@bp.route('/community-insights')
+@organizer_required
+def community_insights():
+    """Community statistics and insights for organizers/admins"""
+    # ?refresh=1 recomputes the snapshot straight away
+    if request.args.get('refresh') or time.monotonic() >= _insights_cache['expires']:
         try:
-            for user_data in top_flakes_query:
-                top_flakes.append({
-                    'name': user_data.name,
-                    'count': user_data.noshow_count,
-                    'role': user_data.role
-                })
+            _insights_cache['value'] = _compute_community_insights()
+            _insights_cache['expires'] = time.monotonic() + _INSIGHTS_TTL
         except Exception as e:
-            print(f"Error calculating top flakes: {e}")
-        
-    except Exception as e:
-        print(f"Error calculating community statistics: {e}")
-        pronoun_stats = {'pronouns': {}}
-        community_stats = {}
-        top_attendees = []
-        top_organizers = []
-        top_flakes = []
-        user_growth_data = []
-    
-    return render_template('admin/community_insights.html',
-                           pronoun_stats=pronoun_stats,
-                           community_stats=community_stats,
-                           top_attendees=top_attendees,
-                           top_organizers=top_organizers,
-                           top_flakes=top_flakes,
-                           user_growth_data=user_growth_data)
+            print(f"Error calculating community statistics: {e}")
+            if _insights_cache['value'] is None:
+                return render_template('admin/community_insights.html',
+                                       pronoun_stats={'pronouns': {}},
+                                       community_stats={},
+                                       top_attendees=[],
+                                       top_organizers=[],
+                                       top_flakes=[],
+                                       user_growth_data=[])
+    
+    return render_template('admin/community_insights.html', **_insights_cache['value'])
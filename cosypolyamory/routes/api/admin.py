@@ -4,17 +4,27 @@ Admin API endpoints
 Handles admin-specific API operations like user management, role changes, etc.
 """
 
+import time
+
 from flask import Blueprint, jsonify, request, current_app
 from flask_login import login_required, current_user
+from peewee import fn, JOIN, Case
 
 from cosypolyamory.models.user import User
 from cosypolyamory.models.user_application import UserApplication
 from cosypolyamory.models.event import Event
 from cosypolyamory.models.rsvp import RSVP
 from cosypolyamory.models.no_show import NoShow
+from cosypolyamory.models.email_verification import EmailVerification
 from cosypolyamory.database import database
-from cosypolyamory.notification import send_notification_email
-from cosypolyamory.email import EmailError
+from cosypolyamory.notification import send_notification_email, send_in_background
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    _dumps = lambda obj: json.dumps(obj).encode('utf-8')
 
 bp = Blueprint('admin', __name__)
 
@@ -30,84 +40,133 @@ def admin_required(f):
     return decorated_function
 
 
+def _json_response(body, status=200):
+    """Build a JSON response from an already serialized body"""
+    return current_app.response_class(body, status=status, mimetype='application/json')
+
+
+# Columns written when an admin changes a user's role
+_ROLE_FIELDS = [User.role, User.is_admin, User.is_organizer, User.is_approved]
+
+_VALID_ROLES = frozenset(['pending', 'approved', 'organizer', 'rejected', 'admin', 'new'])
+
+
+def _parse_pagination(args, default_per_page=50, max_per_page=200):
+    """Read page and per_page from the query string
+    
+    Args:
+        args: Request arguments (request.args)
+        default_per_page: Page size used when none is given
+        max_per_page: Largest page size a client may ask for
+    
+    Returns:
+        tuple: (page, per_page), page at least 1 and per_page within 1..max_per_page
+    """
+    page = max(args.get('page', 1, type=int), 1)
+    per_page = min(max(args.get('per_page', default_per_page, type=int), 1), max_per_page)
+    return page, per_page
+
+
+# Serialized admin user lists keyed by (role, page, per_page). Changes made
+# through the admin pages invalidate them; anything else (new sign-ups,
+# applications) shows up once the entry expires.
+_USER_LIST_TTL = 15  # seconds
+_USER_LIST_MAX_ENTRIES = 256
+_user_list_cache = {}
+
+
+def invalidate_admin_user_lists():
+    """Drop every cached admin user list, e.g. after a user's role changes"""
+    _user_list_cache.clear()
+
+
+# User columns serialized by the admin user lists
+_USER_LIST_FIELDS = (User.id, User.name, User.email, User.avatar_url, User.provider,
+                     User.role, User.created_at, User.last_login)
+
+
+def _latest_application_id():
+    """Correlated subquery selecting the id of the user's newest application"""
+    return (UserApplication
+            .select(UserApplication.id)
+            .where(UserApplication.user == User.id)
+            .order_by(UserApplication.submitted_at.desc())
+            .limit(1)
+            .alias('latest_application_id'))
+
+
+def _no_show_counts(users):
+    """
+    Count the no-shows of several users in one query
+    
+    Returns:
+        dict: user id -> no-show count, only for users with at least one
+    """
+    user_ids = [user.id for user in users]
+    if not user_ids:
+        return {}
+    return dict(NoShow
+                .select(NoShow.user, fn.COUNT(NoShow.id))
+                .where(NoShow.user.in_(user_ids))
+                .group_by(NoShow.user)
+                .tuples())
+
+
 @bp.route('/admin/users/<role>')
 @admin_required
 def api_admin_users_by_role(role):
     """Return paginated list of users by role"""
     try:
-        page = int(request.args.get('page', 1))
-        per_page = int(request.args.get('per_page', 50))
+        page, per_page = _parse_pagination(request.args)
+        
+        # Serve a recent copy of this exact page if there is one
+        cache_key = (role, page, per_page)
+        cached = _user_list_cache.get(cache_key)
+        if cached and time.monotonic() < cached[0]:
+            return _json_response(cached[1])
         
-        # Validate role
-        valid_roles = ['pending', 'approved', 'organizer', 'rejected', 'admin', 'new']
         if role == 'pending':
-            # Show both 'pending' and 'new' users under the pending tab
-            # Fetch all users with role 'pending' or 'new'
-            all_pending_new = list(User.select().where(User.role.in_(['pending', 'new'])))
-            # Split into those with an application and those without
-            with_pending_app = []
-            without_pending_app = []
-            for user in all_pending_new:
-                application = UserApplication.select().where(UserApplication.user == user).first()
-                if application:
-                    with_pending_app.append((user, application))
-                else:
-                    without_pending_app.append((user, None))
-            # Sort with_pending_app by application.submitted_at ascending (oldest first)
-            with_pending_app.sort(key=lambda tup: tup[1].submitted_at if tup[1] else user.created_at)
-            # Sort without_pending_app by user.created_at descending (most recent first)
-            without_pending_app.sort(key=lambda tup: tup[0].created_at, reverse=True)
-            # Merge
-            sorted_users = with_pending_app + without_pending_app
-            # For pagination
-            total = len(sorted_users)
-            page = int(request.args.get('page', 1))
-            per_page = int(request.args.get('per_page', 50))
-            paged = sorted_users[(page-1)*per_page:page*per_page]
-            user_list = []
-            for user, application in paged:
-                # Get no-show count for this user
-                no_show_count = NoShow.select().where(NoShow.user == user).count()
-                
-                user_list.append({
-                    'id': user.id,
-                    'name': user.name,
-                    'email': user.email,
-                    'avatar_url': user.avatar_url,
-                    'provider': user.provider,
-                    'role': user.role,
-                    'created_at': user.created_at.isoformat(),
-                    'last_login': user.last_login.isoformat() if user.last_login else None,
-                    'has_application': bool(application),
-                    'application_id': application.id if application else None,
-                    'application_status': application.status if application else None,
-                    'no_show_count': no_show_count
-                })
-            return jsonify({
-                'users': user_list,
-                'pagination': {
-                    'page': page,
-                    'per_page': per_page,
-                    'total': total,
-                    'pages': (total + per_page - 1) // per_page
-                }
-            })
-        elif role in valid_roles:
-            query = User.select().where(User.role == role).order_by(User.created_at.desc())
+            # Show both 'pending' and 'new' users under the pending tab:
+            # applicants first, oldest application first, then users without
+            # an application, most recent sign-up first
+            latest_submission = (UserApplication
+                                 .select(UserApplication.user.alias('user_id'),
+                                         fn.MAX(UserApplication.submitted_at).alias('submitted_at'))
+                                 .group_by(UserApplication.user)
+                                 .alias('latest_submission'))
+            query = (User
+                     .select(*_USER_LIST_FIELDS, _latest_application_id())
+                     .join(latest_submission, JOIN.LEFT_OUTER,
+                           on=(User.id == latest_submission.c.user_id))
+                     .where(User.role.in_(['pending', 'new']))
+                     .order_by(latest_submission.c.submitted_at.is_null(),
+                               latest_submission.c.submitted_at,
+                               User.created_at.desc()))
+        elif role in _VALID_ROLES:
+            query = (User
+                     .select(*_USER_LIST_FIELDS, _latest_application_id())
+                     .where(User.role == role)
+                     .order_by(User.created_at.desc()))
         else:
             return jsonify({'error': 'Invalid role'}), 400
         
-        # Calculate pagination
-        total = query.count()
-        users = query.paginate(page, per_page)
+        # Calculate pagination; a partly filled page already gives the total,
+        # so COUNT only runs when there may be rows beyond this page
+        users = list(query.paginate(page, per_page))
+        if len(users) < per_page and (users or page == 1):
+            total = (page - 1) * per_page + len(users)
+        else:
+            total = query.count()
+        
+        # No-show counts for the whole page at once
+        no_show_counts = _no_show_counts(users)
         
         user_list = []
         for user in users:
-            # Always get the most recent application for this user
-            application = UserApplication.select().where(UserApplication.user == user).order_by(UserApplication.submitted_at.desc()).first()
-            
-            # Get no-show count for this user
-            no_show_count = NoShow.select().where(NoShow.user == user).count()
+            # The latest application id comes with the user row; its status is
+            # derived from the user's role, so no application row is loaded
+            has_application = user.latest_application_id is not None
+            no_show_count = no_show_counts.get(user.id, 0)
             
             user_list.append({
                 'id': user.id,
@@ -118,13 +177,13 @@ def api_admin_users_by_role(role):
                 'role': user.role,
                 'created_at': user.created_at.isoformat(),
                 'last_login': user.last_login.isoformat() if user.last_login else None,
-                'has_application': bool(application),
-                'application_id': application.id if application else None,
-                'application_status': application.status if application else None,
+                'has_application': has_application,
+                'application_id': user.latest_application_id,
+                'application_status': UserApplication.status_for_role(user.role) if has_application else None,
                 'no_show_count': no_show_count
             })
         
-        return jsonify({
+        body = _dumps({
             'users': user_list,
             'pagination': {
                 'page': page,
@@ -133,6 +192,10 @@ def api_admin_users_by_role(role):
                 'pages': (total + per_page - 1) // per_page
             }
         })
+        if len(_user_list_cache) >= _USER_LIST_MAX_ENTRIES:
+            _user_list_cache.clear()
+        _user_list_cache[cache_key] = (time.monotonic() + _USER_LIST_TTL, body)
+        return _json_response(body)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -142,7 +205,10 @@ def api_admin_users_by_role(role):
 def api_user_details(user_id):
     """Return detailed user information"""
     try:
-        user = User.get_by_id(user_id)
+        user = (User
+                .select(*_USER_LIST_FIELDS, User.pronouns)
+                .where(User.id == user_id)
+                .get())
         
         # Get total no-show count for this user
         no_show_count = NoShow.select().where(NoShow.user == user).count()
@@ -197,20 +263,15 @@ def api_change_user_role():
         with database.atomic():
             # If changing to pending, clear their application data and mark as "new"
             if new_role == 'new':
-                # Delete any existing application
-                deleted_count = 0
-                try:
-                    application = UserApplication.get(UserApplication.user == user)
-                    application.delete_instance()
-                    deleted_count = 1
-                    current_app.logger.info(f"Deleted application for user {user.id} ({user.email}) when marking as new")
-                except UserApplication.DoesNotExist:
+                # Delete any existing applications, including duplicates left
+                # behind by race conditions
+                deleted_count = UserApplication.delete().where(UserApplication.user == user).execute()
+                if deleted_count == 0:
                     current_app.logger.info(f"No application found to delete for user {user.id} ({user.email}) when marking as new")
-                
-                # Also clear any applications that might exist due to race conditions
-                additional_deleted = UserApplication.delete().where(UserApplication.user == user).execute()
-                if additional_deleted > deleted_count:
-                    current_app.logger.warning(f"Found and deleted {additional_deleted} additional applications for user {user.id}")
+                else:
+                    current_app.logger.info(f"Deleted {deleted_count} application(s) for user {user.id} ({user.email}) when marking as new")
+                    if deleted_count > 1:
+                        current_app.logger.warning(f"Found and deleted {deleted_count - 1} additional applications for user {user.id}")
                 
                 # Set role to 'new' instead of 'pending' to indicate fresh start
                 user.role = 'new'
@@ -220,13 +281,16 @@ def api_change_user_role():
             user.is_admin = (user.role == 'admin')
             user.is_organizer = (user.role == 'organizer')
             user.is_approved = (user.role in ['admin', 'organizer', 'approved'])
-            user.save()
+            user.save(only=_ROLE_FIELDS)
+        invalidate_admin_user_lists()
         
-        # Send notifications for role changes
+        # Send notifications for role changes from the background worker;
+        # only queueing can fail here, delivery errors are logged by the worker
         try:
             # Member becoming organizer
             if old_role == 'approved' and user.role == 'organizer':
-                send_notification_email(
+                send_in_background(
+                    send_notification_email,
                     user.email,
                     'role_change_organizer',
                     user=user,
@@ -236,7 +300,8 @@ def api_change_user_role():
             
             # Organizer becoming regular member  
             elif old_role == 'organizer' and user.role == 'approved':
-                send_notification_email(
+                send_in_background(
+                    send_notification_email,
                     user.email,
                     'role_change_member',
                     user=user,
@@ -246,7 +311,8 @@ def api_change_user_role():
             
             # User marked as new (with application data removed)
             elif user.role == 'new' and old_role in ['rejected', 'pending', 'approved', 'organizer']:
-                send_notification_email(
+                send_in_background(
+                    send_notification_email,
                     user.email,
                     'role_change_new',
                     user=user,
@@ -254,12 +320,9 @@ def api_change_user_role():
                     application_removed=True
                 )
                 
-        except EmailError as e:
-            # Log the error but don't fail the role change
-            current_app.logger.error(f"Failed to send role change notification to {user.email}: {str(e)}")
         except Exception as e:
-            # Log any other email errors but don't fail the role change
-            current_app.logger.error(f"Unexpected error sending role change notification to {user.email}: {str(e)}")
+            # Log the error but don't fail the role change
+            current_app.logger.error(f"Failed to queue role change notification to {user.email}: {str(e)}")
         
         return jsonify({
             'success': True, 
@@ -301,29 +364,25 @@ def api_delete_user():
         if user.role == 'deleted' or user.id == 'system_deleted_user':
             return jsonify({'success': False, 'error': 'System accounts cannot be deleted'})
         
-        # Check if user is hosting/co-hosting any events
-        organized_events = list(Event.select().where(Event.organizer == user))
-        co_hosted_events = list(Event.select().where(Event.co_host == user))
+        # Check if user is hosting/co-hosting any events (organized ones first);
+        # the details are only fetched when the deletion is blocked
+        hosted_events = (Event
+                         .select(Event.id, Event.title, Event.date, Event.organizer)
+                         .where((Event.organizer == user) | (Event.co_host == user))
+                         .order_by(Case(None, [(Event.organizer == user, 0)], 1), Event.id))
         
-        if organized_events or co_hosted_events:
+        if hosted_events.exists():
             # Build detailed error message with event links
             error_message = f"Cannot delete {user.name} because they are still hosting events. Please reassign these events first:"
             event_details = []
             
-            for event in organized_events:
-                event_details.append({
-                    'id': event.id,
-                    'title': event.title,
-                    'date': event.date.strftime('%Y-%m-%d'),
-                    'role': 'Organizer'
-                })
-            
-            for event in co_hosted_events:
+            for event in hosted_events:
                 event_details.append({
                     'id': event.id,
                     'title': event.title,
                     'date': event.date.strftime('%Y-%m-%d'),
-                    'role': 'Co-host'
+                    # organizer_id is the raw column, so this doesn't load the organizer
+                    'role': 'Organizer' if event.organizer_id == user.id else 'Co-host'
                 })
             
             return jsonify({
@@ -332,17 +391,27 @@ def api_delete_user():
                 'hosted_events': event_details
             })
 
-        # Delete related records first (UserApplication, RSVP, etc.)
+        # Delete related records first, one bulk statement per table; SQLite
+        # doesn't enforce foreign keys here, so nothing cascades on its own
         with database.atomic():
-            # Delete user applications
+            # Delete user applications and forget reviews made by this user
             UserApplication.delete().where(UserApplication.user == user).execute()
+            UserApplication.update(reviewed_by=None).where(UserApplication.reviewed_by == user).execute()
             
             # Delete RSVPs
             RSVP.delete().where(RSVP.user == user).execute()
             
+            # Delete no-shows; ones this user marked keep the "Deleted User" as marker
+            NoShow.delete().where(NoShow.user == user).execute()
+            NoShow.update(marked_by='system_deleted_user').where(NoShow.marked_by == user).execute()
+            
+            # Delete pending email verifications
+            EmailVerification.delete().where(EmailVerification.user == user).execute()
+            
             # Delete the user
             user_name = user.name
-            user.delete_instance()
+            User.delete().where(User.id == user.id).execute()
+        invalidate_admin_user_lists()
         
         return jsonify({
             'success': True, 
@@ -445,6 +514,7 @@ def api_mark_no_show(event_id):
     except Exception as e:
         current_app.logger.error(f"Error marking no-show for user {user_id} at event {event_id}: {e}")
         return jsonify({'success': False, 'message': 'Database error occurred'}), 500
+    invalidate_admin_user_lists()
 
     # Get total no-show count for this user
     total_no_shows = NoShow.select().where(NoShow.user == user).count()
@@ -492,6 +562,7 @@ def api_remove_no_show(event_id):
     try:
         no_show = NoShow.get((NoShow.user == user) & (NoShow.event == event))
         no_show.delete_instance()
+        invalidate_admin_user_lists()
         
         current_app.logger.info(f"No-show record removed for {user.name} ({user.id}) at event {event.title} ({event.id}) by {current_user.name}")
         
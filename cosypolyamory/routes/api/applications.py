@@ -12,6 +12,7 @@ from flask_login import current_user
 from cosypolyamory.models.user_application import UserApplication
 from cosypolyamory.models.user import User
 from cosypolyamory.database import database
+from cosypolyamory.routes.api.admin import invalidate_admin_user_lists
 
 bp = Blueprint('applications', __name__)
 
@@ -97,6 +98,7 @@ def api_admin_application_review(application_id):
             application.review_notes = notes
             application.save()
             user.save()
+        invalidate_admin_user_lists()
         
         return jsonify({'success': True})
     except UserApplication.DoesNotExist:
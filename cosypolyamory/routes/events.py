@@ -8,6 +8,7 @@ import os
 from datetime import datetime
 from flask import Blueprint, render_template, request, redirect, url_for, flash, current_app, jsonify
 from flask_login import login_required, current_user
+from peewee import JOIN
 
 from cosypolyamory.models.user import User
 from cosypolyamory.models.event import Event
@@ -17,7 +18,7 @@ from cosypolyamory.models.no_show import NoShow
 from cosypolyamory.database import database
 from cosypolyamory.decorators import organizer_required, approved_user_required
 from cosypolyamory.utils import extract_google_maps_info
-from cosypolyamory.notification import send_notification_email, send_rsvp_confirmation, notify_event_updated, notify_event_cancelled, notify_host_assigned, notify_host_removed, send_waitlist_promotion_notification, send_rsvp_update_notification, send_rsvp_update_notification
+from cosypolyamory.notification import send_notification_email, send_rsvp_confirmation, notify_event_updated, bulk_notify, notify_event_cancelled, notify_host_assigned, notify_host_removed, send_waitlist_promotion_notification, send_rsvp_update_notification
 from cosypolyamory.routes.attendance import process_attendance_changes
 
 bp = Blueprint('events', __name__, url_prefix='/events')
@@ -108,13 +109,22 @@ def events_list():
     # Get filter from query parameter, default to 'upcoming'
     current_filter = request.args.get('filter', 'upcoming')
     
+    # Load hosts in the same query so cards don't trigger a lookup per event
+    Organizer = User.alias()
+    CoHost = User.alias()
+    events_with_hosts = (Event
+                         .select(Event, Organizer, CoHost)
+                         .join(Organizer, on=Event.organizer)
+                         .switch(Event)
+                         .join(CoHost, JOIN.LEFT_OUTER, on=Event.co_host))
+    
     # Determine which events to show based on user role
     if current_user.is_authenticated and current_user.role in ['admin', 'organizer']:
         # Admins and organizers can see all events (including drafts)
-        base_query = Event.select().where(Event.is_active == True)
+        base_query = events_with_hosts.where(Event.is_active == True)
     else:
         # Regular users can only see published events
-        base_query = Event.select().where((Event.is_active == True) & (Event.published == True))
+        base_query = events_with_hosts.where((Event.is_active == True) & (Event.published == True))
     
     if current_filter == 'past':
         # Show only past events
@@ -132,7 +142,7 @@ def events_list():
     user_rsvps = {}
     if current_user.is_authenticated and current_user.role in ['approved', 'admin', 'organizer']:
         rsvps = RSVP.select().where(RSVP.user == current_user)
-        user_rsvps = {rsvp.event.id: rsvp for rsvp in rsvps}
+        user_rsvps = {rsvp.event_id: rsvp for rsvp in rsvps}
 
     # Get RSVP counts for the filtered events
     rsvp_counts = {}
@@ -1008,18 +1018,20 @@ def edit_event_post(event_id):
         # Send notifications for significant changes
         if changes:
             # Get all RSVPed users
-            rsvped_users = (User.select().join(RSVP).where((RSVP.event == event) & (RSVP.status == 'yes')))
+            rsvped_users = list(User.select().join(RSVP).where((RSVP.event == event) & (RSVP.status == 'yes')))
 
             # Send update notifications to all attendees
-            for user in rsvped_users:
-                try:
-                    notify_event_updated(user, event, changes=changes)
-                except Exception as e:
-                    current_app.logger.error(f"Failed to send event update notification to {user.email}: {e}")
+            try:
+                results = bulk_notify(event, rsvped_users, "event_updated", changes=changes, update_message=None)
+                for user, success in zip(rsvped_users, results):
+                    if not success:
+                        current_app.logger.error(f"Failed to send event update notification to {user.email}")
+            except Exception as e:
+                current_app.logger.error(f"Failed to send event update notifications for '{event.title}': {e}")
 
             if len(changes) > 0:
                 change_count = len(changes)
-                attendee_count = rsvped_users.count()
+                attendee_count = len(rsvped_users)
                 current_app.logger.info(f"Sent event update notifications for {change_count} changes to {attendee_count} attendees")
 
         # Note: Host assignment/removal notifications are sent automatically by process_attendance_changes()
@@ -1111,21 +1123,22 @@ def delete_event(event_id):
             event.delete_instance()
 
         # Send cancellation notifications to all attendees (after transaction completes)
-        for user in rsvped_users:
+        if rsvped_users:
             try:
-                # Use send_notification_email directly with the stored event data
-                from cosypolyamory.notification import send_notification_email
-                send_notification_email(to_email=user.email,
-                                        template_name="event_cancelled",
-                                        name=user.name,
-                                        event_title=event_title,
-                                        event_date=event_date.strftime('%A, %B %d, %Y'),
-                                        event_time=event_time.strftime('%H:%M') if event_time else "TBD",
-                                        event_location=event_location,
-                                        cancellation_reason="This event has been cancelled by the organizers.",
-                                        base_url=current_app.config.get('BASE_URL', 'https://cosypolyamory.org'))
+                # Use send_bulk_notification directly with the stored event data
+                from cosypolyamory.notification import send_bulk_notification
+                event_vars = dict(event_title=event_title,
+                                  event_date=event_date.strftime('%A, %B %d, %Y'),
+                                  event_time=event_time.strftime('%H:%M') if event_time else "TBD",
+                                  event_location=event_location,
+                                  cancellation_reason="This event has been cancelled by the organizers.",
+                                  base_url=current_app.config.get('BASE_URL', 'https://cosypolyamory.org'))
+                results = send_bulk_notification(rsvped_users, "event_cancelled", event_vars)
+                for user, success in zip(rsvped_users, results):
+                    if not success:
+                        current_app.logger.error(f"Failed to send event cancellation notification to {user.email}")
             except Exception as e:
-                current_app.logger.error(f"Failed to send event cancellation notification to {user.email}: {e}")
+                current_app.logger.error(f"Failed to send event cancellation notifications for '{event_title}': {e}")
 
         attendee_count = len(rsvped_users)
         if attendee_count > 0:
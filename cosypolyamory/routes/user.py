@@ -4,6 +4,7 @@ This module contains user-related routes including profile management,
 user interactions, and application system functionality.
 """
 
+import functools
 import os
 from flask import Blueprint, render_template, redirect, url_for, request, flash
 from flask_login import login_required, current_user, logout_user
@@ -14,11 +15,37 @@ from cosypolyamory.models.rsvp import RSVP
 from cosypolyamory.models.event import Event
 from cosypolyamory.models.no_show import NoShow
 from cosypolyamory.database import database
-from cosypolyamory.notification import notify_application_submitted, notify_organizers_new_application
+from cosypolyamory.notification import notify_application_submitted, notify_organizers_new_application, send_in_background
 
 bp = Blueprint('user', __name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_character_limits(question_keys):
+    """
+    Read the QUESTION_<n>_MINMAX_CHARACTERS limits once per set of questions
+    
+    Args:
+        question_keys: Tuple of question keys in question order
+        
+    Returns:
+        dict: Mapping of question key to {'min': int, 'max': int}
+    """
+    character_limits = {}
+    for i, question_key in enumerate(question_keys, 1):
+        limit_config = os.getenv(f'QUESTION_{i}_MINMAX_CHARACTERS', '100_1000')
+        try:
+            min_chars, max_chars = limit_config.split('_')
+            character_limits[question_key] = {
+                'min': int(min_chars),
+                'max': int(max_chars)
+            }
+        except (ValueError, IndexError):
+            # Default values if parsing fails
+            character_limits[question_key] = {'min': 100, 'max': 1000}
+    return character_limits
+
+
 @bp.route('/apply')
 @login_required
 def apply():
@@ -45,18 +72,7 @@ def apply():
     questions = UserApplication.get_questions_from_env()
     
     # Get character limits from environment
-    character_limits = {}
-    for i, question_key in enumerate(questions.keys(), 1):
-        limit_config = os.getenv(f'QUESTION_{i}_MINMAX_CHARACTERS', '100_1000')
-        try:
-            min_chars, max_chars = limit_config.split('_')
-            character_limits[question_key] = {
-                'min': int(min_chars),
-                'max': int(max_chars)
-            }
-        except (ValueError, IndexError):
-            # Default values if parsing fails
-            character_limits[question_key] = {'min': 100, 'max': 1000}
+    character_limits = _get_character_limits(tuple(questions.keys()))
     
     return render_template('user/apply.html', questions=questions, character_limits=character_limits)
 
@@ -88,17 +104,7 @@ def submit_application():
     questions = UserApplication.get_questions_from_env()
     
     # Validate character limits
-    character_limits = {}
-    for i, question_key in enumerate(questions.keys(), 1):
-        limit_config = os.getenv(f'QUESTION_{i}_MINMAX_CHARACTERS', '100_1000')
-        try:
-            min_chars, max_chars = limit_config.split('_')
-            character_limits[question_key] = {
-                'min': int(min_chars),
-                'max': int(max_chars)
-            }
-        except (ValueError, IndexError):
-            character_limits[question_key] = {'min': 100, 'max': 1000}
+    character_limits = _get_character_limits(tuple(questions.keys()))
     
     # Validate each answer
     validation_errors = []
@@ -150,9 +156,9 @@ def submit_application():
             from flask import current_app
             current_app.logger.error(f"Failed to send application confirmation notification to {current_user.email}: {e}")
             
-        # Send notification to organizers about new application
+        # Notify organizers about the new application without making the applicant wait
         try:
-            notify_organizers_new_application(current_user)
+            send_in_background(notify_organizers_new_application, current_user._get_current_object())
         except Exception as e:
             from flask import current_app
             current_app.logger.error(f"Failed to send organizer notification for new application from {current_user.email}: {e}")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Database migration: Add indexes for the pending application queue
+
+This script adds the users.role index used to find pending applicants and the
+user_applications.submitted_at index used to order the moderation queue. Both
+are created with IF NOT EXISTS, so it is safe to run more than once.
+"""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cosypolyamory.database import database
+from cosypolyamory.models.user import User
+from cosypolyamory.models.user_application import UserApplication
+
+
+def migrate():
+    """Add indexes for the pending application queue"""
+    print("🔧 Starting database migration: Add application queue indexes")
+    
+    try:
+        database.connect()
+        
+        for model in (User, UserApplication):
+            table_name = model._meta.table_name
+            if not model.table_exists():
+                print(f"ℹ️  Table '{table_name}' does not exist. Skipping.")
+                continue
+            
+            # Create any missing indexes declared on the model
+            model._schema.create_indexes(safe=True)
+            print(f"✅ Successfully created '{table_name}' indexes")
+        
+        database.close()
+        print("✅ Migration completed successfully")
+        
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Database migration: Add indexes to email_verifications table
+
+This script adds the expires_at index used by cleanup_expired and the partial
+index on pending verifications per user. Both are created with IF NOT EXISTS,
+so it is safe to run more than once.
+"""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cosypolyamory.database import database
+from cosypolyamory.models.email_verification import EmailVerification
+
+
+def migrate():
+    """Add indexes to email_verifications table"""
+    print("🔧 Starting database migration: Add email_verifications indexes")
+    
+    try:
+        database.connect()
+        
+        if not EmailVerification.table_exists():
+            print("ℹ️  Table 'email_verifications' does not exist. Run add_email_verification_table.py first.")
+            database.close()
+            return
+        
+        # Create any missing indexes declared on the model
+        EmailVerification._schema.create_indexes(safe=True)
+        print("✅ Successfully created 'email_verifications' indexes")
+        
+        database.close()
+        print("✅ Migration completed successfully")
+        
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    migrate()
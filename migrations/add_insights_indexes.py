@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Database migration: Add indexes for community insights and user lists
+
+This script adds the (role, created_at) and last_login indexes on users and
+the (exact_time, organizer) / (exact_time, co_host) indexes on events, then
+drops the single-column users.role index that (role, created_at) replaces.
+It is safe to run more than once.
+"""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cosypolyamory.database import database
+from cosypolyamory.models.user import User
+from cosypolyamory.models.event import Event
+
+
+def migrate():
+    """Add indexes for community insights and user lists"""
+    print("🔧 Starting database migration: Add community insights indexes")
+    
+    try:
+        database.connect()
+        
+        for model in (User, Event):
+            table_name = model._meta.table_name
+            if not model.table_exists():
+                print(f"ℹ️  Table '{table_name}' does not exist. Skipping.")
+                continue
+            
+            # Create any missing indexes declared on the model
+            model._schema.create_indexes(safe=True)
+            print(f"✅ Successfully created '{table_name}' indexes")
+        
+        # users.role is covered by the leading column of (role, created_at)
+        database.execute_sql('DROP INDEX IF EXISTS "user_role"')
+        print("✅ Dropped redundant 'user_role' index")
+        
+        database.close()
+        print("✅ Migration completed successfully")
+        
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Database migration: Index user_applications by (user_id, submitted_at)
+
+This script adds the (user_id, submitted_at) index used to find each user's
+latest application, then drops the single-column user_id index it replaces.
+It is safe to run more than once.
+"""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cosypolyamory.database import database
+from cosypolyamory.models.user_application import UserApplication
+
+
+def migrate():
+    """Index user_applications by (user_id, submitted_at)"""
+    print("🔧 Starting database migration: Add user_applications (user_id, submitted_at) index")
+    
+    try:
+        database.connect()
+        
+        if not UserApplication.table_exists():
+            print("ℹ️  Table 'user_applications' does not exist. Nothing to migrate.")
+            database.close()
+            return
+        
+        # Create any missing indexes declared on the model
+        UserApplication._schema.create_indexes(safe=True)
+        print("✅ Successfully created 'user_applications' indexes")
+        
+        # user_id is covered by the leading column of (user_id, submitted_at)
+        database.execute_sql('DROP INDEX IF EXISTS "userapplication_user_id"')
+        print("✅ Dropped redundant 'userapplication_user_id' index")
+        
+        database.close()
+        print("✅ Migration completed successfully")
+        
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    migrate()
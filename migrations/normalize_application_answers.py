@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Database migration: Normalize stored application answers
+
+Older applications store their answers as a plain list or as
+{"question_1": "answer"}. This script rewrites every such row in the canonical
+{"question_1": {"question": "...", "answer": "..."}} format, matching the
+questions from the current environment. Rows already in the canonical format
+are left untouched, so it is safe to run more than once.
+"""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cosypolyamory.database import database
+from cosypolyamory.models.user_application import UserApplication
+
+
+def migrate():
+    """Rewrite application answers in the canonical format"""
+    print("🔧 Starting database migration: Normalize user_applications answers")
+    
+    try:
+        database.connect()
+        
+        if not UserApplication.table_exists():
+            print("ℹ️  Table 'user_applications' does not exist. Nothing to migrate.")
+            database.close()
+            return
+        
+        updated = 0
+        with database.atomic():
+            for application in UserApplication.select().where(UserApplication.answers.is_null(False)):
+                original = application.answers
+                application.set_questions_and_answers(application.get_questions_and_answers())
+                if application.answers != original:
+                    application.save(only=[UserApplication.answers])
+                    updated += 1
+        
+        print(f"✅ Normalized answers for {updated} application(s)")
+        
+        database.close()
+        print("✅ Migration completed successfully")
+        
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    migrate()
@@ -30,7 +30,7 @@ from cosypolyamory.app import app
 from cosypolyamory.models.event import Event
 from cosypolyamory.models.rsvp import RSVP
 from cosypolyamory.models.user import User
-from cosypolyamory.notification import send_event_reminder
+from cosypolyamory.notification import send_event_reminders
 from cosypolyamory.telegram_integration import TelegramNotificationService
 
 # Configuration
@@ -131,13 +131,13 @@ def send_reminders_for_today():
         
         attendees = get_attendees_for_event(event)
         
-        # Send individual email reminders
-        for user in attendees:
-            try:
-                # Send reminder within Flask app context
-                with app.app_context():
-                    success = send_event_reminder(user, event)
-                    
+        # Send email reminders to all attendees in one batch
+        try:
+            # Send reminders within Flask app context
+            with app.app_context():
+                results = send_event_reminders(attendees, event)
+            
+            for user, success in zip(attendees, results):
                 if success:
                     summary['reminders_sent'] += 1
                     logger.info(f"Sent reminder to {user.email} for {event.title}")
@@ -145,11 +145,11 @@ def send_reminders_for_today():
                     summary['reminders_failed'] += 1
                     logger.warning(f"Failed to send reminder to {user.email} for {event.title}")
                     
-            except Exception as e:
-                summary['reminders_failed'] += 1
-                error_msg = f"Error sending reminder to {user.email} for {event.title}: {e}"
-                logger.error(error_msg)
-                summary['errors'].append(error_msg)
+        except Exception as e:
+            summary['reminders_failed'] += len(attendees)
+            error_msg = f"Error sending reminders for {event.title}: {e}"
+            logger.error(error_msg)
+            summary['errors'].append(error_msg)
         
         # Send Telegram group notification for this event
         try: